@@ -17,6 +17,7 @@ from __future__ import division
 from __future__ import print_function
 
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -91,16 +92,72 @@ class DisplayLayerManager(object):
     ACTIVE_LAYER = "CTX_Active"
     INACTIVE_LAYER = "CTX_Inactive"
 
+    # Scene events after which the global layers must be ensured again
+    SCENE_RESET_EVENTS = ("NewSceneOpened", "SceneOpened")
+
     def __init__(self):
         """Initialize display layer manager."""
+        self._global_layers_ensured = False
+        self._scene_jobs = []
+        self._register_scene_callbacks()
+
         # Ensure global layers exist
         self.ensure_global_layers()
 
+    def __del__(self):
+        """Kill the scene callbacks if the owner never unregistered them."""
+        try:
+            self.unregister_scene_callbacks()
+        except Exception:
+            pass
+
+    def _register_scene_callbacks(self):
+        """Reset the global layer flag whenever a new scene is loaded.
+
+        The callback only holds a weak reference, so the jobs do not keep
+        the manager alive; they are killed by unregister_scene_callbacks() or
+        on deletion.
+        """
+        ref = weakref.ref(self)
+
+        def on_scene_reset():
+            manager = ref()
+            if manager is not None:
+                manager.reset_global_layers()
+
+        for event in self.SCENE_RESET_EVENTS:
+            try:
+                job_id = cmds.scriptJob(event=[event, on_scene_reset])
+                self._scene_jobs.append(job_id)
+            except Exception as e:
+                logger.debug("Could not register {} callback: {}".format(event, e))
+
+    def unregister_scene_callbacks(self):
+        """Kill the scene callbacks registered by this manager."""
+        for job_id in self._scene_jobs:
+            try:
+                cmds.scriptJob(kill=job_id, force=True)
+            except Exception as e:
+                logger.debug("Could not kill scriptJob {}: {}".format(job_id, e))
+        self._scene_jobs = []
+
+    def reset_global_layers(self):
+        """Force the next ensure_global_layers() call to check the scene again."""
+        self._global_layers_ensured = False
+
     def ensure_global_layers(self):
         """Ensure CTX_Active and CTX_Inactive layers exist.
 
         Creates the layers if they don't exist and sets their visibility.
+        Runs once per scene; later calls only check that both layers still
+        exist until reset_global_layers() is called (done automatically on
+        scene new/open). A layer deleted mid-scene is recreated.
         """
+        if (self._global_layers_ensured
+                and cmds.objExists(self.ACTIVE_LAYER)
+                and cmds.objExists(self.INACTIVE_LAYER)):
+            return
+
         # Create CTX_Active layer (visible)
         if not cmds.objExists(self.ACTIVE_LAYER):
             cmds.createDisplayLayer(name=self.ACTIVE_LAYER, empty=True, noRecurse=True)
@@ -117,6 +174,8 @@ class DisplayLayerManager(object):
         # Set inactive layer hidden
         self.hide_layer(self.INACTIVE_LAYER)
 
+        self._global_layers_ensured = True
+
     def _connect_visibility_to_active(self, shot_node, layer_name):
         """Connect display layer visibility to CTX_Shot is_active attribute.
 
@@ -728,6 +787,44 @@ class DisplayLayerManager(object):
             except:
                 pass
 
+    def set_layers_visibility(self, layer_names, visible):
+        """Set visibility of multiple display layers in one batch.
+
+        All visibility changes, and the Layer Editor button refresh for each
+        layer, are sent as a single MEL command so the DG is dirtied once
+        instead of once per layer.
+
+        Args:
+            layer_names (list): Display layer names
+            visible (bool): True to show, False to hide
+        """
+        if not layer_names:
+            return
+
+        value = 1 if visible else 0
+
+        try:
+            import maya.mel as mel
+        except ImportError:
+            # No MEL outside Maya - fall back to per-layer updates
+            for layer_name in layer_names:
+                self.set_layer_visibility(layer_name, visible)
+            return
+
+        # Attributes first; the UI refresh is wrapped in catchQuiet so a missing
+        # layer button (e.g. Layer Editor closed) cannot abort the batch
+        statements = ['setAttr "{}.visibility" {}'.format(layer_name, value)
+                      for layer_name in layer_names]
+        statements.extend('catchQuiet(`layerButton -edit -layerVisible {} "{}"`)'.format(
+            value, layer_name) for layer_name in layer_names)
+
+        try:
+            mel.eval(";".join(statements))
+        except Exception:
+            # Batch failed (e.g. a layer was deleted) - fall back to per-layer updates
+            for layer_name in layer_names:
+                self.set_layer_visibility(layer_name, visible)
+
     def show_layer(self, layer_name):
         """Show display layer.
 
@@ -17,11 +17,23 @@ from __future__ import division
 from __future__ import print_function
 
 import logging
+import weakref
 
 logger = logging.getLogger(__name__)
 
+# Qt is optional here; without it debounced switches run immediately
+try:
+    from PySide6 import QtCore
+except ImportError:
+    try:
+        from PySide2 import QtCore
+    except ImportError:
+        QtCore = None
+
 try:
     import maya.cmds as cmds
+    import maya.mel as mel
+    import maya.api.OpenMaya as om
     MAYA_AVAILABLE = True
 except ImportError:
     # Mock Maya commands for testing outside Maya
@@ -45,8 +57,18 @@ except ImportError:
             return []
     
     cmds = MockCmds()
+    mel = None
+    om = None
     MAYA_AVAILABLE = False
 
+# Non-blocking viewport refresh; optional, since the UI API can be missing
+# (mayapy without UI, older Maya) while maya.cmds still works
+try:
+    from maya.api.OpenMayaUI import M3dView
+    _schedule_refresh = M3dView.scheduleRefreshAllViews
+except (ImportError, AttributeError):
+    _schedule_refresh = None
+
 
 class ShotSwitcher(object):
     """Manage shot switching and visibility updates.
@@ -72,6 +94,16 @@ class ShotSwitcher(object):
         'CTX_Shot_SH0170'
     """
     
+    __slots__ = ('layer_manager', 'context_manager', 'history', 'max_history',
+                 '_shots_cache', '_shots_jobs', '_scene_jobs', '_shot_info_cache',
+                 '_pending', '_timer', '_can_refresh', '__weakref__')
+
+    # Scene events after which cached shot connections may be stale
+    CACHE_RESET_EVENTS = ("NewSceneOpened", "SceneOpened", "NameChanged")
+
+    # Shot attributes read on every switch (ep, seq, shot)
+    SHOT_INFO_ATTRS = ("ep_code", "seq_code", "shot_code")
+
     def __init__(self, layer_manager, context_manager=None):
         """Initialize shot switcher.
         
@@ -83,6 +115,14 @@ class ShotSwitcher(object):
         self.context_manager = context_manager
         self.history = []  # List of shot nodes in switch order
         self.max_history = 20  # Maximum history entries
+        self._shots_cache = {}  # manager_node -> connected CTX_Shot nodes
+        self._shots_jobs = {}  # manager_node -> scriptJob id invalidating the cache
+        self._scene_jobs = []  # scriptJob ids dropping the whole cache, see CACHE_RESET_EVENTS
+        self._shot_info_cache = {}  # shot_node -> (MObjectHandle, MFnDependencyNode)
+        self._pending = None  # Latest debounced switch arguments
+        self._timer = None  # Single-shot QTimer, created on first debounced switch
+        # Viewports only exist in interactive sessions
+        self._can_refresh = MAYA_AVAILABLE and not cmds.about(batch=True)
     
     def switch_to_shot(self, shot_node, manager_node, hide_others=True):
         """Switch to a different shot.
@@ -106,9 +146,7 @@ class ShotSwitcher(object):
             raise ValueError("Manager node '{}' does not exist".format(manager_node))
 
         # Get shot info
-        ep = cmds.getAttr("{}.ep_code".format(shot_node))
-        seq = cmds.getAttr("{}.seq_code".format(shot_node))
-        shot = cmds.getAttr("{}.shot_code".format(shot_node))
+        ep, seq, shot = self._get_shot_info(shot_node)
         logger.info("Shot info: ep={}, seq={}, shot={}".format(ep, seq, shot))
 
         # Ensure global display layers exist (CTX_Active and CTX_Inactive)
@@ -116,7 +154,7 @@ class ShotSwitcher(object):
         logger.info("Ensured global display layers exist")
 
         # Update manager's active shot
-        cmds.setAttr("{}.active_shot_id".format(manager_node), shot_node, type="string")
+        cmds.setAttr(manager_node + ".active_shot_id", shot_node, type="string")
         logger.info("Updated manager active_shot_id to: {}".format(shot_node))
 
         # Deactivate other shots FIRST (before activating the new one)
@@ -125,23 +163,67 @@ class ShotSwitcher(object):
             self._deactivate_other_shots(shot_node, manager_node)
 
         # Set this shot as active (this will automatically show its layer via connection)
-        cmds.setAttr("{}.is_active".format(shot_node), True)
+        cmds.setAttr(shot_node + ".is_active", True)
         logger.info("Set {}.is_active = True".format(shot_node))
 
         # Add to history
         self._add_to_history(shot_node)
 
-        # Refresh the Layer Editor UI to show visibility changes
-        try:
-            cmds.refresh(force=True)
-            logger.info("Forced viewport refresh")
-        except Exception as e:
-            logger.warning("Failed to refresh viewport: {}".format(e))
+        # Schedule a viewport refresh to show visibility changes. Unlike
+        # cmds.refresh(force=True) this does not block; Maya redraws on idle
+        # and coalesces it with any other pending refresh requests.
+        if self._can_refresh:
+            if _schedule_refresh is not None:
+                _schedule_refresh()
+                logger.info("Scheduled viewport refresh")
+            else:
+                try:
+                    cmds.refresh(force=True)
+                    logger.info("Forced viewport refresh")
+                except Exception as e:
+                    logger.warning("Failed to refresh viewport: {}".format(e))
 
         logger.info("Shot switch complete!")
         logger.info("=" * 60)
         return True
     
+    def switch_to_shot_debounced(self, shot_node, manager_node, hide_others=True, delay=50):
+        """Switch to a shot once calls have stopped arriving for `delay` ms.
+
+        Bursts of requests (double-clicks, key repeat, selection sync) are
+        coalesced so only the last one is switched to. Without a running Qt
+        application the switch happens immediately.
+
+        Args:
+            shot_node (str): CTX_Shot node name to switch to
+            manager_node (str): CTX_Manager node name
+            hide_others (bool): If True, hide other shots' layers
+            delay (int): Quiet period in milliseconds
+        """
+        if QtCore is None or QtCore.QCoreApplication.instance() is None:
+            self.switch_to_shot(shot_node, manager_node, hide_others)
+            return
+
+        self._pending = (shot_node, manager_node, hide_others)
+
+        if self._timer is None:
+            self._timer = QtCore.QTimer()
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._flush_pending_switch)
+
+        self._timer.start(delay)
+
+    def _flush_pending_switch(self):
+        """Run the latest debounced switch."""
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+
+        try:
+            self.switch_to_shot(*pending)
+        except ValueError as e:
+            logger.error("Debounced shot switch failed: {}".format(e))
+
     def get_active_shot(self, manager_node):
         """Get currently active shot.
 
@@ -234,14 +316,146 @@ class ShotSwitcher(object):
             manager_node (str): CTX_Manager node name
         """
         # Get all shot nodes connected to manager
-        all_shots = cmds.listConnections("{}.shots".format(manager_node), source=True, destination=False) or []
+        all_shots = self._get_shots(manager_node)
+
+        other_shots = [shot for shot in all_shots if shot != active_shot_node]
+        if not other_shots:
+            return
+
+        # Shots connected to the manager always have is_active, so deactivate
+        # them all in one MEL command without per-shot objExists checks
+        if mel is not None:
+            try:
+                mel.eval(";".join("setAttr {}.is_active 0".format(shot) for shot in other_shots))
+                logger.info("Deactivated {} other shots".format(len(other_shots)))
+                return
+            except Exception as e:
+                logger.warning("Batched shot deactivation failed, falling back to per-shot: {}".format(e))
+
+        for shot in other_shots:
+            is_active_attr = shot + ".is_active"
+            if cmds.objExists(is_active_attr):
+                cmds.setAttr(is_active_attr, False)
+                logger.info("Set {} = False".format(is_active_attr))
+
+    def _get_shot_info(self, shot_node):
+        """Read ep/seq/shot codes from a CTX_Shot node.
+
+        Inside Maya the plugs are read through a cached API 2.0
+        MFnDependencyNode instead of one cmds.getAttr call per attribute.
+
+        Args:
+            shot_node (str): CTX_Shot node name
+
+        Returns:
+            tuple: (ep_code, seq_code, shot_code)
+        """
+        if om is None:
+            return tuple(cmds.getAttr(shot_node + "." + attr)
+                         for attr in self.SHOT_INFO_ATTRS)
+
+        cached = self._shot_info_cache.get(shot_node)
+        if cached is None or not cached[0].isValid() or cached[1].name() != shot_node:
+            sel = om.MSelectionList()
+            sel.add(shot_node)
+            node_obj = sel.getDependNode(0)
+            cached = (om.MObjectHandle(node_obj), om.MFnDependencyNode(node_obj))
+            self._shot_info_cache[shot_node] = cached
+
+        fn_node = cached[1]
+        return tuple(fn_node.findPlug(attr, False).asString()
+                     for attr in self.SHOT_INFO_ATTRS)
+
+    def _get_shots(self, manager_node):
+        """Get CTX_Shot nodes connected to manager, cached per manager.
+
+        The cached list is dropped by a connectionChange scriptJob as soon as
+        the manager's shots attribute changes, and the whole cache is dropped
+        on new scene, scene open and any node rename. If the jobs cannot be
+        created (e.g. outside Maya), the connections are queried every time.
+        The jobs are killed by cleanup().
 
-        # Deactivate all except the active one
-        for shot in all_shots:
-            if shot != active_shot_node:
-                if cmds.objExists("{}.is_active".format(shot)):
-                    cmds.setAttr("{}.is_active".format(shot), False)
-                    logger.info("Set {}.is_active = False".format(shot))
+        Args:
+            manager_node (str): CTX_Manager node name
+
+        Returns:
+            list: CTX_Shot node names
+        """
+        shots = self._shots_cache.get(manager_node)
+        if shots is not None:
+            return shots
+
+        shots = cmds.listConnections(manager_node + ".shots", source=True, destination=False) or []
+
+        try:
+            if not self._scene_jobs:
+                callback = self._weak_callback(self._clear_shots_cache)
+                for event in self.CACHE_RESET_EVENTS:
+                    self._scene_jobs.append(cmds.scriptJob(event=[event, callback]))
+            self._shots_jobs[manager_node] = cmds.scriptJob(
+                connectionChange=[manager_node + ".shots",
+                                  self._weak_callback(self._invalidate_shots, manager_node)],
+                runOnce=True,
+                killWithScene=True
+            )
+            self._shots_cache[manager_node] = shots
+        except Exception as e:
+            logger.debug("Not caching shots for {}: {}".format(manager_node, e))
+
+        return shots
+
+    def _weak_callback(self, method, *args):
+        """Wrap a bound method for a scriptJob without keeping self alive.
+
+        Args:
+            method (instancemethod): Bound method of this switcher
+            *args: Arguments passed to the method
+
+        Returns:
+            callable: Callback that does nothing once the switcher is gone
+        """
+        ref = weakref.ref(self)
+        func = method.__func__
+
+        def callback():
+            switcher = ref()
+            if switcher is not None:
+                func(switcher, *args)
+        return callback
+
+    def _invalidate_shots(self, manager_node):
+        """Drop cached shot connections for manager.
+
+        Args:
+            manager_node (str): CTX_Manager node name
+        """
+        self._shots_cache.pop(manager_node, None)
+        self._shots_jobs.pop(manager_node, None)
+
+    def _clear_shots_cache(self):
+        """Drop cached shot connections for every manager."""
+        self._shots_cache.clear()
+        self._kill_jobs(self._shots_jobs.values())
+        self._shots_jobs.clear()
+
+    def _kill_jobs(self, job_ids):
+        """Kill scriptJobs that are still running.
+
+        Args:
+            job_ids (iterable): scriptJob ids
+        """
+        for job_id in list(job_ids):
+            try:
+                if cmds.scriptJob(exists=job_id):
+                    cmds.scriptJob(kill=job_id, force=True)
+            except Exception as e:
+                logger.debug("Could not kill scriptJob {}: {}".format(job_id, e))
+
+    def cleanup(self):
+        """Kill the cache scriptJobs; call when the switcher is torn down."""
+        self._clear_shots_cache()
+        self._kill_jobs(self._scene_jobs)
+        self._scene_jobs = []
 
     def _add_to_history(self, shot_node):
         """Add shot to history.
@@ -263,16 +477,12 @@ class ShotSwitcher(object):
     def show_all_shots(self):
         """Show all shot layers."""
         all_layers = self.layer_manager.get_all_ctx_layers()
-
-        for layer in all_layers:
-            self.layer_manager.show_layer(layer)
+        self.layer_manager.set_layers_visibility(all_layers, True)
 
     def hide_all_shots(self):
         """Hide all shot layers."""
         all_layers = self.layer_manager.get_all_ctx_layers()
-
-        for layer in all_layers:
-            self.layer_manager.hide_layer(layer)
+        self.layer_manager.set_layers_visibility(all_layers, False)
 
     def isolate_shot(self, shot_node, manager_node):
         """Isolate a single shot (show only this shot).
@@ -14,6 +14,12 @@ from __future__ import print_function
 
 import re
 
+try:
+    from sys import intern
+except ImportError:
+    # Python 2: intern is a builtin
+    pass
+
 
 class TokenExpander(object):
     """Token expansion engine for template paths.
@@ -28,6 +34,8 @@ class TokenExpander(object):
         'Ep04/sq0070/SH0170'
     """
     
+    __slots__ = ()
+
     # Token pattern: $tokenName (camelCase convention)
     # Matches: $ep, $projRoot, $assetName, $sceneBase
     # Underscore (_) is used ONLY as separator, NOT part of token names
@@ -49,7 +57,8 @@ class TokenExpander(object):
         Returns:
             str: Expanded template with tokens replaced
         """
-        if not template:
+        # Fully resolved paths (no '$' left) skip the context copy and regex
+        if not template or '$' not in template:
             return template
         
         # Make a copy of context
@@ -61,7 +70,9 @@ class TokenExpander(object):
         
         # Find all tokens
         def replace_token(match):
-            token_name = match.group(1)
+            # Interned so the dict probe can short-circuit on identity when the
+            # context keys are string literals (interned by the compiler)
+            token_name = intern(match.group(1))
             
             # Get value from context
             value = ctx.get(token_name)
@@ -70,7 +81,7 @@ class TokenExpander(object):
                 # Leave token unexpanded
                 return match.group(0)
             
-            return str(value)
+            return value if type(value) is str else str(value)
         
         # Replace all tokens
         expanded = self.TOKEN_PATTERN.sub(replace_token, template)
@@ -113,17 +124,8 @@ class TokenExpander(object):
         if not template:
             return []
         
-        matches = self.TOKEN_PATTERN.findall(template)
-        
         # Return unique tokens in order of first appearance
-        seen = set()
-        result = []
-        for token in matches:
-            if token not in seen:
-                seen.add(token)
-                result.append(token)
-        
-        return result
+        return list(dict.fromkeys(self.TOKEN_PATTERN.findall(template)))
     
     def get_token_values(self, template, context):
         """Get dictionary of token names and their values from context.
@@ -5,6 +5,9 @@ Run this in Maya Script Editor:
     import sys
     sys.path.insert(0, r'E:/dev/maya-multishot')
     exec(open(r'E:/dev/maya-multishot/launch_multishot_dockable.py').read())
+
+Set the MULTISHOT_RELOAD environment variable to force the pipeline
+modules to be re-imported (useful while developing).
 """
 
 from __future__ import absolute_import
@@ -26,14 +29,17 @@ if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
     print("Added to sys.path: {}".format(repo_root))
 
-# Clear cached modules
-modules_to_remove = [key for key in list(sys.modules.keys()) 
-                     if key.startswith(('ui', 'core', 'config', 'tools'))]
-for module in modules_to_remove:
-    del sys.modules[module]
+# Clear cached modules (only when a reload is requested, e.g. during development)
+if os.environ.get('MULTISHOT_RELOAD'):
+    packages = ('ui', 'core', 'config', 'tools')
+    prefixes = tuple(package + '.' for package in packages)
+    modules_to_remove = [key for key in sys.modules.copy()
+                         if key in packages or key.startswith(prefixes)]
+    for module in modules_to_remove:
+        del sys.modules[module]
 
-if modules_to_remove:
-    print("Cleared {} cached modules".format(len(modules_to_remove)))
+    if modules_to_remove:
+        print("Cleared {} cached modules".format(len(modules_to_remove)))
 
 # Enable logging
 logging.basicConfig(
@@ -41,47 +47,39 @@ logging.basicConfig(
     format='%(name)s - %(levelname)s: %(message)s'
 )
 
-# Import Maya modules
-try:
-    import maya.cmds as cmds
-    from maya import OpenMayaUI as omui
-except ImportError:
-    print("✗ ERROR: This script must be run inside Maya!")
-    raise
-
-# Import Qt
-try:
-    from PySide6 import QtWidgets, QtCore
-    from shiboken6 import wrapInstance
-except ImportError:
-    from PySide2 import QtWidgets, QtCore
-    from shiboken2 import wrapInstance
-
-# Verify imports work
-try:
-    from ui.dockable_window import DockableMainWindow
-    print("✓ DockableMainWindow imported successfully")
-except ImportError as e:
-    print("✗ Import error: {}".format(e))
-    raise
-
 
 def get_maya_main_window():
     """Get Maya main window as a Qt widget."""
+    from maya import OpenMayaUI as omui
+
+    try:
+        from PySide6 import QtWidgets
+        from shiboken6 import wrapInstance
+    except ImportError:
+        from PySide2 import QtWidgets
+        from shiboken2 import wrapInstance
+
     main_window_ptr = omui.MQtUtil.mainWindow()
     return wrapInstance(int(main_window_ptr), QtWidgets.QWidget)
 
 
 def launch_dockable():
     """Launch Multishot Manager with Maya docking using dockControl (simpler approach)."""
+    # Heavy Maya/Qt/pipeline imports are deferred until a launch is requested
+    try:
+        import maya.cmds as cmds
+        from maya import OpenMayaUI as omui
+    except ImportError:
+        print("✗ ERROR: This script must be run inside Maya!")
+        raise
 
     from ui.main_window import MainWindow
 
-    # Close existing window if it exists
-    if MainWindow._instance is not None:
+    # Close existing windows if any
+    for instance in list(MainWindow._instances):
         try:
-            MainWindow._instance.close()
-            MainWindow._instance.deleteLater()
+            instance.close()
+            instance.deleteLater()
         except:
             pass
 
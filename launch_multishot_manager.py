@@ -5,6 +5,9 @@ Run this in Maya Script Editor:
     import sys
     sys.path.insert(0, r'E:/dev/maya-multishot')
     exec(open(r'E:/dev/maya-multishot/launch_multishot_manager.py').read())
+
+Set the MULTISHOT_RELOAD environment variable to force the pipeline
+modules to be re-imported (useful while developing).
 """
 
 from __future__ import absolute_import
@@ -27,14 +30,17 @@ if repo_root not in sys.path:
     sys.path.insert(0, repo_root)
     print("Added to sys.path: {}".format(repo_root))
 
-# Clear cached modules
-modules_to_remove = [key for key in list(sys.modules.keys()) 
-                     if key.startswith(('ui', 'core', 'config', 'tools'))]
-for module in modules_to_remove:
-    del sys.modules[module]
+# Clear cached modules (only when a reload is requested, e.g. during development)
+if os.environ.get('MULTISHOT_RELOAD'):
+    packages = ('ui', 'core', 'config', 'tools')
+    prefixes = tuple(package + '.' for package in packages)
+    modules_to_remove = [key for key in sys.modules.copy()
+                         if key in packages or key.startswith(prefixes)]
+    for module in modules_to_remove:
+        del sys.modules[module]
 
-if modules_to_remove:
-    print("Cleared {} cached modules".format(len(modules_to_remove)))
+    if modules_to_remove:
+        print("Cleared {} cached modules".format(len(modules_to_remove)))
 
 # Enable logging
 logging.basicConfig(
@@ -42,39 +48,43 @@ logging.basicConfig(
     format='%(name)s - %(levelname)s: %(message)s'
 )
 
-# Verify imports work
-try:
-    from config.project_config import ProjectConfig
-    print("✓ ProjectConfig imported successfully")
-    
-    # Verify method exists
-    config = ProjectConfig()
-    if hasattr(config, 'get_token_values'):
-        print("✓ ProjectConfig.get_token_values() method exists")
-    else:
-        print("✗ WARNING: ProjectConfig.get_token_values() method NOT found!")
-    
-    from core.context import ContextManager
-    print("✓ ContextManager imported successfully")
-    
-    from core.asset_scanner import AssetScanner
-    print("✓ AssetScanner imported successfully")
-    
-    from ui.main_window import MainWindow
-    print("✓ MainWindow imported successfully")
-    
-except ImportError as e:
-    print("✗ Import error: {}".format(e))
-    raise
+def verify_imports():
+    """Import the pipeline modules one by one and report which ones fail."""
+    try:
+        from config.project_config import ProjectConfig
+        print("✓ ProjectConfig imported successfully")
 
-# Launch window
-try:
-    # Import Qt for finding existing windows
+        # Verify method exists
+        config = ProjectConfig()
+        if hasattr(config, 'get_token_values'):
+            print("✓ ProjectConfig.get_token_values() method exists")
+        else:
+            print("✗ WARNING: ProjectConfig.get_token_values() method NOT found!")
+
+        from core.context import ContextManager
+        print("✓ ContextManager imported successfully")
+
+        from core.asset_scanner import AssetScanner
+        print("✓ AssetScanner imported successfully")
+
+        from ui.main_window import MainWindow
+        print("✓ MainWindow imported successfully")
+
+    except ImportError as e:
+        print("✗ Import error: {}".format(e))
+        raise
+
+
+def launch():
+    """Launch Multishot Manager as a floating window."""
+    # Heavy Qt/pipeline imports are deferred until a launch is requested
     try:
         from PySide6 import QtWidgets
     except ImportError:
         from PySide2 import QtWidgets
 
+    from ui.main_window import MainWindow
+
     # Find and close any existing Multishot Manager windows by object name
     app = QtWidgets.QApplication.instance()
     if app:
@@ -97,9 +107,18 @@ try:
     print("  2. Or use: Window > Saved Layouts > Edit Layouts")
     print("  3. Window will resize automatically based on table content")
 
+    return window
+
+
+# Verify imports only when developing (modules were just reloaded)
+if os.environ.get('MULTISHOT_RELOAD'):
+    verify_imports()
+
+# Launch window
+try:
+    window = launch()
 except Exception as e:
     print("✗ Failed to launch window: {}".format(e))
     import traceback
     traceback.print_exc()
     raise
-
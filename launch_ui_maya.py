@@ -25,13 +25,14 @@ import os
 def launch():
     """Launch the Context Manager UI."""
     
-    # Get the directory where this script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
-    # Add to Python path if not already there
-    if script_dir not in sys.path:
-        sys.path.insert(0, script_dir)
-        print("Added to Python path: {}".format(script_dir))
+    # Add this script's directory to Python path (once per session, so
+    # repeated shelf-button clicks skip the sys.path scan)
+    if not getattr(launch, '_path_added', False):
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        if script_dir not in sys.path:
+            sys.path.insert(0, script_dir)
+            print("Added to Python path: {}".format(script_dir))
+        launch._path_added = True
     
     # Import and launch UI
     try:
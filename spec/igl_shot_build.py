@@ -9,18 +9,36 @@
 
 from __future__ import print_function
 import json, ast, os, re
+from collections import namedtuple
 import maya.cmds as cmds
+import maya.api.OpenMaya as om2
+
+# Thread pools need concurrent.futures (Python 3, or the futures backport on 2.7);
+# without it every file probe runs serially on the calling thread
+try:
+    import concurrent.futures
+except ImportError:
+    concurrent = None
 
 # Qt imports (Maya 2020+ ships PySide2)
 try:
-    from PySide2 import QtWidgets, QtCore
+    from PySide2 import QtWidgets, QtCore, QtGui
     from shiboken2 import wrapInstance
 except Exception:
-    from PySide6 import QtWidgets, QtCore
+    from PySide6 import QtWidgets, QtCore, QtGui
     from shiboken6 import wrapInstance
 
 import maya.OpenMayaUI as omui
 
+# Optional instance-based Sets builder; resolved once, None when not installed
+try:
+    from . import sets_instance_builder as _sets_instance_builder
+except ImportError:
+    try:
+        import sets_instance_builder as _sets_instance_builder
+    except ImportError:
+        _sets_instance_builder = None
+
 WIN_TITLE  = "Pipeline Tools - Shot Build - Place3D - BlendShape - Assign Shader"
 WIN_OBJECT = "EE_PipelineTools_ShotBuild_AllInOne"
 
@@ -28,9 +46,15 @@ WIN_OBJECT = "EE_PipelineTools_ShotBuild_AllInOne"
 # Common helpers
 # -----------------------------------------------------------------------------
 
+_MAIN_WIN = None
+
 def _maya_main_window():
-    ptr = omui.MQtUtil.mainWindow()
-    return wrapInstance(int(ptr), QtWidgets.QWidget)
+    # The Maya main window lives for the whole session; wrap it only once
+    global _MAIN_WIN
+    if _MAIN_WIN is None:
+        ptr = omui.MQtUtil.mainWindow()
+        _MAIN_WIN = wrapInstance(int(ptr), QtWidgets.QWidget)
+    return _MAIN_WIN
 
 def _short(node):
     return node.split(":")[-1] if node else node
@@ -38,34 +62,150 @@ def _short(node):
 def _list_namespaces():
     ns = (cmds.namespaceInfo(listOnlyNamespaces=True) or [])
     bad = {"UI", "shared"}
-    out = []
-    for n in ns:
-        if n in bad:
-            continue
-        if cmds.ls(n + ":*", long=True):
-            out.append(n)
-    return sorted(out, key=lambda x: (x.count(":"), x))
+    # One scene scan: collect the namespace of every node's leaf name
+    populated = set()
+    for node in cmds.ls() or []:
+        leaf = node.rsplit("|", 1)[-1]
+        if ":" in leaf:
+            populated.add(leaf.rsplit(":", 1)[0])
+    # Sort by depth, then name (decorate once instead of a key lambda)
+    decorated = [(n.count(":"), n) for n in ns if n not in bad and n in populated]
+    decorated.sort()
+    return [n for _, n in decorated]
+
+TRS_CHANNELS = ("translateX","translateY","translateZ",
+                "rotateX","rotateY","rotateZ",
+                "scaleX","scaleY","scaleZ")
 
 def _unlock_trs(node):
-    for ch in ("translateX","translateY","translateZ",
-               "rotateX","rotateY","rotateZ",
-               "scaleX","scaleY","scaleZ"):
-        a = "{}.{}".format(node, ch)
-        if cmds.objExists(a):
+    # Query lock/keyable state once, then only touch channels that need it
+    locked = set(cmds.listAttr(node, locked=True) or [])
+    keyable = set(cmds.listAttr(node, keyable=True) or [])
+    # Transforms and joints always have every TRS channel
+    has_trs = cmds.nodeType(node) in ("transform", "joint")
+    for ch in TRS_CHANNELS:
+        if ch not in locked and ch in keyable:
+            continue
+        a = node + "." + ch
+        if has_trs or cmds.objExists(a):
             try:
-                if cmds.getAttr(a, lock=True):
+                if ch in locked:
                     cmds.setAttr(a, lock=False)
-                cmds.setAttr(a, keyable=True)
+                if ch not in keyable:
+                    cmds.setAttr(a, keyable=True)
             except Exception:
                 pass
 
+# Top-level asset groups of a built shot scene
+_SCENE_GROUPS = ("Camera_Grp", "Character_Grp", "Setdress_Grp", "Props_Grp", "Sets_Grp", "Dressing_Grp")
+
+def _existing_nodes(names):
+    """Set of the given node names that exist, from a single ls call."""
+    return set(n.rpartition("|")[2] for n in (cmds.ls(list(names)) or []))
+
+def _in_namespace(nodes, namespace):
+    """Nodes whose leaf name lives directly in namespace (not a nested one)."""
+    return [n for n in nodes if n.rpartition("|")[2].rpartition(":")[0] == namespace]
+
+def _scene_loc_transforms():
+    """Long names of every locator transform in the scene whose name ends in _Loc.
+
+    One batched listRelatives resolves the parents of all locator shapes.
+    """
+    shapes = cmds.ls(type="locator", long=True) or []
+    if not shapes:
+        return []
+    parents = cmds.listRelatives(shapes, parent=True, fullPath=True) or []
+    return [p for p in parents if p.endswith("_Loc")]
+
+def _transform_children(parents):
+    """Map each parent path to the long names of its direct plain-transform children.
+
+    Walks the DAG in-process with API 2.0 rather than a listRelatives and a
+    nodeType per parent. Only MFn.kTransform counts, so constraints, joints
+    and other transform-derived nodes are excluded, as nodeType == "transform" did.
+    """
+    result = {}
+    k_transform = om2.MFn.kTransform
+    for parent in parents:
+        sel = om2.MSelectionList()
+        sel.add(parent)
+        dag = sel.getDagPath(0)
+        children = []
+        for i in range(dag.childCount()):
+            child = dag.child(i)
+            if child.apiType() == k_transform:
+                path = om2.MDagPath(dag)
+                path.push(child)
+                children.append(path.fullPathName())
+        result[parent] = children
+    return result
+
+def _reference_top_nodes(ref_nodes):
+    """Long names of the plain transforms in ref_nodes whose parent is not in ref_nodes.
+
+    Two ls calls replace a nodeType and a listRelatives per node; the parent
+    comes from the long name and is tested against a set.
+    """
+    if not ref_nodes:
+        return []
+    ref_set = set(cmds.ls(ref_nodes, long=True) or [])
+    return [t for t in (cmds.ls(ref_nodes, exactType="transform", long=True) or [])
+            if t.rpartition("|")[0] not in ref_set]
+
+def _is_shot_publish_cache(asset):
+    """True for caches from a shot publish dir named {ep}_{seq}_{shot}__{category}_{name}_{id}.abc."""
+    filename = asset['filename']
+    return ("/publish/" in asset['full_path'].replace('\\', '/')
+            and "__" in filename and filename.endswith(".abc"))
+
+def _reference_index():
+    """Map each reference namespace (no leading ':') to (reference node, filename).
+
+    One pass over the scene's reference nodes, so per-asset lookups are dict
+    hits instead of a referenceQuery scan of every reference.
+    """
+    index = {}
+    for ref in cmds.ls(type="reference") or []:
+        if ref == "sharedReferenceNode":
+            continue
+        try:
+            ns = cmds.referenceQuery(ref, namespace=True).lstrip(":")
+            index.setdefault(ns, (ref, cmds.referenceQuery(ref, filename=True)))
+        except Exception:
+            continue
+    return index
+
+def _scene_namespaces():
+    """Every namespace in the scene, nested ones included, without a leading ':'."""
+    return set(ns.lstrip(":") for ns in
+               (cmds.namespaceInfo(":", listOnlyNamespaces=True, recurse=True) or []))
+
+def _child_namespace_names(namespace):
+    """Leaf names of the namespaces directly under namespace (empty if it does not exist)."""
+    if not cmds.namespace(exists=namespace):
+        return set()
+    return set(ns.rpartition(":")[2] for ns in
+               (cmds.namespaceInfo(namespace, listOnlyNamespaces=True) or []))
+
+def _top_level_transforms(namespace, new_nodes=None):
+    """Transforms of a namespace parented directly under the world (long names).
+
+    A long name with a single leading "|" has no parent, so one ls call
+    replaces a listRelatives per node. Pass the nodes returned by a
+    returnNewNodes reference to filter those instead of globbing the scene.
+    """
+    if new_nodes is None:
+        xforms = cmds.ls(namespace + ":*", type="transform", long=True) or []
+    else:
+        xforms = _in_namespace(cmds.ls(new_nodes, type="transform", long=True) or [], namespace)
+    return [n for n in xforms if n.rfind("|") == 0]
+
 def _first_mesh_shape(xform):
     """Return first non-intermediate mesh shape under transform."""
-    shapes = cmds.listRelatives(xform, shapes=True, ni=True, fullPath=True) or []
-    for s in shapes:
-        if cmds.nodeType(s) == "mesh" and not cmds.getAttr(s + ".intermediateObject"):
-            return s
-    return None
+    # ni=True already drops intermediate objects; type filters meshes in Maya
+    shapes = cmds.listRelatives(xform, shapes=True, ni=True, type="mesh", fullPath=True) or []
+    return shapes[0] if shapes else None
 
 # =============================================================================
 # Shot Build Helper Functions
@@ -80,121 +220,209 @@ CATEGORY_MAPPINGS = {
     "Dressing": "DRSG"  # New shot-based dressing category
 }
 
+# Cache of filesystem checks, keyed by (check, path). Network shares make
+# every stat a round-trip, and several tabs resolve the same asset roots.
+# Cleared whenever the user refreshes or reloads the cache list.
+_STAT_CACHE = {}
+
+# Shared pool for small batches of independent file probes; threads start on first use
+_PROBE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4) if concurrent else None
+
+class _SerialProbe(object):
+    """Future stand-in that runs the probe when its result is asked for."""
+
+    def __init__(self, fn, args):
+        self._fn = fn
+        self._args = args
+
+    def result(self):
+        return self._fn(*self._args)
+
+def _submit_probe(fn, *args):
+    """Run fn(*args) on the probe pool; deferred and serial when there is no pool."""
+    if _PROBE_POOL is None:
+        return _SerialProbe(fn, args)
+    return _PROBE_POOL.submit(fn, *args)
+
+def _clear_stat_cache():
+    """Forget cached filesystem checks."""
+    _STAT_CACHE.clear()
+    _PARSE_CACHE.clear()
+
+def _cached_exists(path):
+    """os.path.exists, memoized until the next _clear_stat_cache()."""
+    key = ("exists", path)
+    if key not in _STAT_CACHE:
+        _STAT_CACHE[key] = os.path.exists(path)
+    return _STAT_CACHE[key]
+
+def _cached_isdir(path):
+    """os.path.isdir, memoized until the next _clear_stat_cache()."""
+    key = ("isdir", path)
+    if key not in _STAT_CACHE:
+        _STAT_CACHE[key] = os.path.isdir(path)
+    return _STAT_CACHE[key]
+
 def _validate_directory(path):
     """Check if directory exists and is accessible."""
     try:
-        return os.path.exists(path) and os.path.isdir(path)
+        return _cached_isdir(path)
     except Exception:
         return False
 
+def _subdir_names(parent_path):
+    """Unsorted names of the subdirectories in parent_path.
+
+    os.scandir reuses the directory entry type, so there is no extra stat
+    per item; Python 2.7 has no scandir and falls back to listdir + isdir.
+    Raises OSError when parent_path cannot be listed.
+    """
+    if not hasattr(os, "scandir"):
+        return [name for name in os.listdir(parent_path)
+                if os.path.isdir(os.path.join(parent_path, name))]
+    with os.scandir(parent_path) as it:
+        return [e.name for e in it if e.is_dir()]
+
 def _list_directories(parent_path):
     """List subdirectories in parent_path, return sorted list."""
-    if not _validate_directory(parent_path):
-        return []
     try:
-        dirs = []
-        for item in os.listdir(parent_path):
-            full_path = os.path.join(parent_path, item)
-            if os.path.isdir(full_path):
-                dirs.append(item)
-        return sorted(dirs)
-    except Exception:
+        return sorted(_subdir_names(parent_path))
+    except OSError:
         return []
 
+def _dir_set(parent_path):
+    """Names of the subdirectories in parent_path, for membership tests.
+
+    Unsorted, and memoized in the stat cache so every asset of a category
+    shares a single listing of the category folder.
+    """
+    key = ("dirset", parent_path)
+    if key not in _STAT_CACHE:
+        try:
+            _STAT_CACHE[key] = frozenset(_subdir_names(parent_path))
+        except OSError:
+            _STAT_CACHE[key] = frozenset()
+    return _STAT_CACHE[key]
+
+# Shot context in a scene path: .../<project>/all/scene/Ep01/sq0010/SH0020/...
+_SCENE_PATH_RE = re.compile(r'(?:^|/)[Ss][Cc][Ee][Nn][Ee]/(Ep[^/]*)/(sq[^/]*)/(SH[^/]*)')
+_PROJECT_DIR_RE = re.compile(r'([^/]+)/all(?=/|$)')
+_PROJECT_DIR_ANYCASE_RE = re.compile(r'([^/]+)/all(?=/|$)', re.IGNORECASE)
+# Shot context in a scene file name: Ep01_sq0010_SH0020_lighting_v001.ma
+_SCENE_FILE_RE = re.compile(r'(?:^|_)(Ep\d+).*?[_-](sq\d+).*?[_-](SH\d+)', re.IGNORECASE)
+
+def _split_shot_tokens(filename):
+    """(episode, sequence, shot) from underscore-separated Ep##/sq##/SH## tokens.
+
+    Cheap path for the usual Ep01_sq0010_SH0020_... names; returns None when
+    the tokens are not all there, in order, so _SCENE_FILE_RE can have a go.
+    """
+    found = []
+    prefixes = ('Ep', 'sq', 'SH')
+    for tok in filename.split('_'):
+        prefix = prefixes[len(found)]
+        if tok[:2] == prefix and tok[2:].isdigit():
+            found.append(tok)
+            if len(found) == 3:
+                return tuple(found)
+    return None
+
+# Anim publish folder of a shot ({root} ends in a separator); forward slashes
+# are fine for Maya on Windows
+_SCENE_TPL = "{root}{project}/all/scene/{episode}/{sequence}/{shot}/anim/publish"
+
+_VER_RE = re.compile(r'^v(\d+)$')
+
 def _list_versions(version_path):
     """List version directories, return sorted with latest first."""
-    if not _validate_directory(version_path):
-        return []
     try:
-        versions = []
-        for item in os.listdir(version_path):
-            full_path = os.path.join(version_path, item)
-            if os.path.isdir(full_path):
-                versions.append(item)
-        # Sort versions with latest first (assuming v001, v002, etc format)
-        versions.sort(reverse=True)
-        return versions
-    except Exception:
+        names = _subdir_names(version_path)
+    except OSError:
         return []
+    versions = []
+    others = []
+    for name in names:
+        m = _VER_RE.match(name)
+        if m:
+            versions.append((int(m.group(1)), name))
+        else:
+            others.append(name)
+    # Latest first by version number, so v1000 sorts above v999;
+    # directories not named v### follow
+    versions.sort(reverse=True)
+    others.sort(reverse=True)
+    return [name for _, name in versions] + others
+
+# Cache filename patterns, compiled once at import.
+# Camera: SWA_Ep01_SH0020_camera (4+ parts, last part contains "camera")
+_CAM_RE = re.compile(r'^(?:[^_]*_){3,}[^_]*camera[^_]*$', re.IGNORECASE)
+_CAM_EP_RE = re.compile(r'(?:^|_)(Ep[^_]*)(?=_|$)')
+_CAM_SHOT_RE = re.compile(r'(?:^|_)(SH[^_]*)(?=_|$)')
+# Standard: Ep01_sq0010_SH0020__PROP_ChickenAlarmClock_001 or Ep01_sq0010_SH0020__DRSG_SH0240
+_STD_RE = re.compile(r'^(?P<ep>[^_]+)_(?P<seq>[^_]+)_(?P<shot>[^_]+)(?:_[^_]+)*'
+                     r'__(?P<category>[^_]+)_(?P<rest>.+)$')
+
+ParsedCache = namedtuple('ParsedCache', 'ep seq shot category name identifier namespace')
+
+def _parse_camera_base(base):
+    """ParsedCache for a camera file name (extension already stripped)."""
+    eps = _CAM_EP_RE.findall(base)
+    shots = _CAM_SHOT_RE.findall(base)
+    return ParsedCache(
+        eps[-1] if eps else 'Ep01',
+        'sq0000',  # Default sequence for cameras
+        shots[-1] if shots else 'SH0000',
+        'CAM', 'camera', '001', 'CAM_camera_001'
+    )
+
+# Parsed cache file names, keyed by filename; cleared with the stat cache
+_PARSE_CACHE = {}
 
 def _parse_cache_filename(filename):
     """Parse cache filename: Ep01_sq0010_SH0020__PROP_ChickenAlarmClock_001.abc
     Also handles camera files: SWA_Ep01_SH0020_camera.abc
-    Returns dict with ep, seq, shot, category, name, identifier"""
+    Returns ParsedCache(ep, seq, shot, category, name, identifier, namespace)
+    or None (memoized per filename)"""
+    if filename not in _PARSE_CACHE:
+        _PARSE_CACHE[filename] = _parse_cache_filename_uncached(filename)
+    return _PARSE_CACHE[filename]
+
+def _parse_cache_filename_uncached(filename):
+    """Parse one cache filename; see _parse_cache_filename."""
     if not filename.endswith('.abc'):
         return None
 
     base = filename[:-4]  # remove .abc
-    try:
-        # Check for camera files first (different pattern)
-        if 'camera' in base.lower():
-            # Handle camera files: SWA_Ep01_SH0020_camera
-            parts = base.split('_')
-            if len(parts) >= 4 and 'camera' in parts[-1].lower():
-                # Extract episode and shot info
-                ep = None
-                shot = None
-                for part in parts:
-                    if part.startswith('Ep'):
-                        ep = part
-                    elif part.startswith('SH'):
-                        shot = part
-
-                return {
-                    'ep': ep or 'Ep01',
-                    'seq': 'sq0000',  # Default sequence for cameras
-                    'shot': shot or 'SH0000',
-                    'category': 'CAM',
-                    'name': 'camera',
-                    'identifier': '001',
-                    'namespace': 'CAM_camera_001'
-                }
 
-        # Standard format: Split by double underscore first
-        if '__' not in base:
-            return None
+    # Camera files normally end in "_camera"; a tail compare settles them
+    # without scanning the whole name
+    if base[-7:].lower() == '_camera' and base.count('_') >= 3:
+        return _parse_camera_base(base)
 
-        shot_part, asset_part = base.split('__', 1)
+    m = _STD_RE.match(base)
+    if not m:
+        # Older camera names carry "camera" somewhere else in the name
+        if _CAM_RE.match(base):
+            return _parse_camera_base(base)
+        return None
 
-        # Parse shot part: Ep01_sq0010_SH0020
-        shot_parts = shot_part.split('_')
-        if len(shot_parts) < 3:
+    category = m.group('category')
+    rest = m.group('rest')
+
+    # Special handling for DRSG (Dressing) - format: DRSG_{shot}
+    if category == 'DRSG' and '_' not in rest:
+        name = rest  # Shot name (e.g., SH0240)
+        identifier = '001'  # Default identifier for DRSG
+        namespace = category + '_' + name  # DRSG_SH0240
+    else:
+        # Standard format: CATEGORY_name_identifier (name may contain underscores)
+        name, sep, identifier = rest.rpartition('_')
+        if not sep:
             return None
+        namespace = category + '_' + name + '_' + identifier
 
-        ep = shot_parts[0]
-        seq = shot_parts[1]
-        shot = shot_parts[2]
-
-        # Parse asset part: PROP_ChickenAlarmClock_001 or DRSG_SH0240
-        asset_parts = asset_part.split('_')
-
-        # Special handling for DRSG (Dressing) - format: DRSG_{shot}
-        if asset_parts[0] == 'DRSG' and len(asset_parts) == 2:
-            category = asset_parts[0]
-            name = asset_parts[1]  # Shot name (e.g., SH0240)
-            identifier = '001'  # Default identifier for DRSG
-            namespace = '{}_{}'.format(category, name)  # DRSG_SH0240
-        else:
-            # Standard format: CATEGORY_name_identifier
-            if len(asset_parts) < 3:
-                return None
-
-            category = asset_parts[0]
-            name = '_'.join(asset_parts[1:-1])  # Handle multi-part names
-            identifier = asset_parts[-1]
-            namespace = '{}_{}_{}'.format(category, name, identifier)
-
-        return {
-            'ep': ep,
-            'seq': seq,
-            'shot': shot,
-            'category': category,
-            'name': name,
-            'identifier': identifier,
-            'namespace': namespace
-        }
-    except Exception:
-        return None
+    return ParsedCache(m.group('ep'), m.group('seq'), m.group('shot'),
+                       category, name, identifier, namespace)
 
 def _get_asset_namespace(category, name, identifier):
     """Generate namespace for asset: CATEGORY_name_identifier"""
@@ -235,20 +463,311 @@ def _find_shader_paths(category, name, project_root="V:/SWA"):
 
     return shader_paths
 
+# Category folders under <project>/all/asset used when referencing shaders
+_SHADER_CATEGORY_DIRS = {
+    "CHAR": "Character",
+    "PROP": "Props",
+    "SDRS": "Setdress",
+    "SETS": "Sets"
+}
+
+def _shader_search_paths(root, project, category, name):
+    """Hero directories that may hold the shader/groom files of an asset.
+
+    Returns an empty list for categories without shaders.
+    """
+    category_dir = _SHADER_CATEGORY_DIRS.get(category)
+    if not category_dir:
+        return []
+
+    if category == "SETS":
+        # Sets: Exterior and Interior
+        subdirs = ("Exterior", "Interior")
+    elif category == "SDRS":
+        # Setdress: Check name for Int/Ext, then try all paths
+        if "Int" in name:
+            subdirs = ("interior", "Interior")
+        elif "Ext" in name:
+            subdirs = ("exterior", "Exterior")
+        else:
+            subdirs = ("interior", "Interior", "exterior", "Exterior", "Main", "object")
+    else:
+        # Character, Props: Main and object
+        subdirs = ("Main", "object")
+
+    return [os.path.join(root, project, "all", "asset", category_dir, sub, name, "hero")
+            for sub in subdirs]
+
+def _has_hero_dir(hero_path):
+    """True if hero_path (<bucket>/<asset>/hero) is a directory.
+
+    Missing assets are ruled out against one shared listing of the bucket
+    folder, so only assets that are actually there cost a stat of their own.
+    """
+    asset_dir = os.path.dirname(hero_path)
+    bucket, asset = os.path.split(asset_dir)
+    return asset in _dir_set(bucket) and _validate_directory(hero_path)
+
+def _probe_shader_dir(path, name):
+    """Warm the stat cache for one hero directory and its shader/groom files."""
+    if _has_hero_dir(path):
+        _cached_exists(os.path.join(path, "{}_rsshade.ma".format(name)))
+        _cached_exists(os.path.join(path, "{}_groom.ma".format(name)))
+
+def _prefetch_shader_paths(root, project, assets, max_workers=16):
+    """Probe the shader locations of many assets concurrently.
+
+    Every probe is a network round-trip on the project share, and os.stat
+    releases the GIL, so the lookups are overlapped in a thread pool. The
+    answers land in the stat cache that _reference_shader_and_groom reads.
+    """
+    jobs = []
+    for asset in assets:
+        name = asset['name']
+        for path in _shader_search_paths(root, project, asset['category'], name):
+            jobs.append((path, name))
+    if not jobs:
+        return
+
+    if concurrent is None:
+        for job in jobs:
+            _probe_shader_dir(*job)
+        return
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as ex:
+        list(ex.map(lambda job: _probe_shader_dir(*job), jobs))
+
+_WARM_BYTES = 1 << 20
+
+# Read-ahead gets its own pool so nothing waiting on a probe result queues
+# behind a backlog of 1 MB reads
+_WARM_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4) if concurrent else None
+
+def _warm_file(path):
+    """Pull the start of a cache file into the OS page cache ahead of Maya.
+
+    Opening and reading the head of the file (and hinting the kernel where
+    supported) in a worker overlaps the network fetch with Maya's work on
+    the previous asset.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    except OSError:
+        return
+    try:
+        if hasattr(os, "posix_fadvise"):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        os.read(fd, _WARM_BYTES)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+# -----------------------------------------------------------------------------
+# Background directory listing
+# -----------------------------------------------------------------------------
+
+class _ScanSignals(QtCore.QObject):
+    done = QtCore.Signal(int, str, object)  # token, path, result
+
+
+class _ScanTask(QtCore.QRunnable):
+    """Runs func(path) on the Qt thread pool and emits the result back."""
+
+    def __init__(self, token, path, func):
+        super(_ScanTask, self).__init__()
+        self.token = token
+        self.path = path
+        self.func = func
+        self.signals = _ScanSignals()
+
+    def run(self):
+        try:
+            result = self.func(self.path)
+        except Exception:
+            result = []
+        self.signals.done.emit(self.token, self.path, result)
+
+
+# -----------------------------------------------------------------------------
+# Assets table (model/view: no per-cell items or button widgets)
+# -----------------------------------------------------------------------------
+
+# Assets table column widths: Cache File, Category, Name, Identifier, Namespace, Status, Build, Update
+ASSET_COLUMN_WIDTHS = (260, 80, 140, 100, 140, 90, 80, 80)
+
+class AssetsModel(QtCore.QAbstractTableModel):
+    """Serves the shot build asset dicts to a QTableView without copying them."""
+
+    HEADERS = ("Cache File", "Category", "Name", "Identifier", "Namespace", "Status", "Build", "Update")
+    COLS = ('filename', 'category', 'name', 'identifier', 'namespace', 'status')
+    STATUS_COL = 5
+    BUILD_COL = 6
+    UPDATE_COL = 7
+    UPDATE_TIP = "Update this asset from new version (only geometry from */publish/{version} paths)"
+
+    def __init__(self, parent=None):
+        super(AssetsModel, self).__init__(parent)
+        self._assets = []
+        self._row_cache = {}  # row -> display texts of every column
+
+    def set_assets(self, assets):
+        """Show a new asset list (kept by reference, not copied)."""
+        self.beginResetModel()
+        self._assets = assets
+        self._row_cache.clear()
+        self.endResetModel()
+
+    def row_texts(self, row):
+        """Display texts of a whole row, built once and reused by every paint."""
+        texts = self._row_cache.get(row)
+        if texts is None:
+            asset = self._assets[row]
+            texts = tuple(asset.get(key, "") for key in self.COLS[:self.STATUS_COL]) + (
+                asset.get('status', "Ready"), "Build", "Update")
+            self._row_cache[row] = texts
+        return texts
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._assets)
+
+    def columnCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        col = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            return self.row_texts(index.row())[col]
+        if role == QtCore.Qt.ToolTipRole and col == self.UPDATE_COL:
+            return self.UPDATE_TIP
+        return None
+
+    def headerData(self, section, orientation, role=QtCore.Qt.DisplayRole):
+        if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def set_status(self, filename, status):
+        """Set the status of the asset with this cache filename. Returns True if found."""
+        for row, asset in enumerate(self._assets):
+            if asset['filename'] == filename:
+                asset['status'] = status
+                self._row_cache.pop(row, None)
+                index = self.index(row, self.STATUS_COL)
+                self.dataChanged.emit(index, index)
+                return True
+        return False
+
+
+class AssetsTextDelegate(QtWidgets.QStyledItemDelegate):
+    """Fills the style option from AssetsModel's cached row texts.
+
+    The stock initStyleOption queries data() once per role (display, font,
+    colours, alignment, check state, decoration...) for every cell on every
+    paint. The assets table only ever shows plain text, so one lookup in the
+    model's row cache is enough; the model is asked directly to skip the
+    QVariant round-trip.
+    """
+
+    def initStyleOption(self, option, index):
+        option.text = index.model().row_texts(index.row())[index.column()]
+        option.features |= QtWidgets.QStyleOptionViewItem.HasDisplay
+        option.displayAlignment = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+
+
+class ButtonDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints push buttons in the cells of its columns; emits clicked(row, column) on release."""
+
+    clicked = QtCore.Signal(int, int)
+
+    def __init__(self, colors, parent=None):
+        super(ButtonDelegate, self).__init__(parent)
+        self._colors = dict((col, QtGui.QColor(color)) for col, color in colors.items())
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionButton()
+        opt.rect = option.rect.adjusted(2, 2, -2, -2)
+        opt.text = index.data()
+        opt.state = QtWidgets.QStyle.State_Enabled | QtWidgets.QStyle.State_Raised
+        opt.palette.setColor(QtGui.QPalette.Button, self._colors[index.column()])
+        opt.palette.setColor(QtGui.QPalette.ButtonText, QtCore.Qt.white)
+        opt.fontMetrics = option.fontMetrics
+        widget = option.widget
+        style = widget.style() if widget else QtWidgets.QApplication.style()
+        painter.save()
+        font = QtGui.QFont(option.font)
+        font.setBold(True)
+        painter.setFont(font)
+        style.drawControl(QtWidgets.QStyle.CE_PushButton, opt, painter, widget)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QtCore.QEvent.MouseButtonRelease
+                and event.button() == QtCore.Qt.LeftButton
+                and option.rect.contains(event.pos())):
+            self.clicked.emit(index.row(), index.column())
+            return True
+        return super(ButtonDelegate, self).editorEvent(event, model, option, index)
+
+# Styles of the shot build tab widgets, keyed by object name, applied as one
+# tab-wide sheet so Qt parses a single stylesheet instead of one per widget
+_SHOT_BUILD_STYLE = (
+    "QPushButton#load_cache_btn { font-weight: bold; }"
+    "QPushButton#auto_detect_btn { background-color: #4CAF50; color: white; }"
+    "QCheckBox#verbose_logging_checkbox { font-weight: bold; color: #4CAF50; }"
+    "QCheckBox#use_matrix_method_checkbox { font-weight: bold; color: #2196F3; }"
+    "QCheckBox#use_sets_instances_checkbox { font-weight: bold; color: #FF9800; }"
+    "QPushButton#build_all_btn { font-weight: bold; background-color: #2196F3; color: white; padding: 10px; font-size: 14px; }"
+    "QPushButton#build_subprocess_btn { font-weight: bold; background-color: #9C27B0; color: white; padding: 8px; }"
+    "QPushButton#batch_build_btn { font-weight: bold; background-color: #FF5722; color: white; padding: 8px; }"
+    "QPushButton#update_assets_btn { font-weight: bold; background-color: #FF9800; color: white; padding: 8px; }"
+    "QPushButton#build_assets_btn { font-weight: bold; background-color: #4CAF50; color: white; }"
+)
+
 # =============================================================================
 # TAB 1: Shot Build System
 # =============================================================================
 
 class ShotBuildTab(QtWidgets.QWidget):
+    # Scene group each asset category is parented under
+    _CATEGORY_GROUPS = {
+        "CHAR": "Character_Grp",
+        "PROP": "Props_Grp",
+        "SDRS": "Setdress_Grp",
+        "SETS": "Sets_Grp",
+        "DRSG": "Dressing_Grp",  # New dressing group for shot-based dressing
+        "CAM": "Camera_Grp",
+        "CAMERA": "Camera_Grp"
+    }
+
     def __init__(self, parent=None):
         super(ShotBuildTab, self).__init__(parent)
         self.assets_data = []  # Store parsed asset information
+        self._assets_by_category = {}  # category -> assets, in assets_data order
+        self._expected_namespaces = frozenset()  # namespaces the loaded assets reference
+        self._verbose = False  # mirrors verbose_logging_checkbox
+        self._root = ""  # stripped root_path_edit text, kept in sync by _on_root_changed
+        self._root_dir = ""  # same, ending in a separator, for building paths
         self.current_shot_path = ""
+        self._dir_cache = {}  # path -> sorted subdirectory names, until Refresh
+        self._neg_cache = set()  # paths known to be missing or empty, until Refresh
+        self._scan_token = 0  # latest background listing; older results are dropped
+        self._sync_scans = False  # list on the UI thread (auto-detect needs the results at once)
+        self._scan_target = None  # _fill_dirs arguments of the latest background listing
+        self._combo_index = {}  # combo -> {item text: index}, rebuilt when it is refilled
+        # (asset root, component) -> (geo_file, shader_file, category, subdir); geo_file
+        # is None for components that were not found. Cleared per Sets build / cache load
+        self._asset_lookup_cache = {}
+        self._scan_pool = QtCore.QThreadPool(self)  # own pool; Maya's global one is left alone
+        self._scan_pool.setMaxThreadCount(4)
         self._build()
         self._wire()
 
     def _build(self):
         layout = QtWidgets.QVBoxLayout(self)
+        self.setStyleSheet(_SHOT_BUILD_STYLE)
 
         # Directory Root Configuration
         root_layout = QtWidgets.QHBoxLayout()
@@ -296,12 +815,12 @@ class ShotBuildTab(QtWidgets.QWidget):
         btn_layout = QtWidgets.QHBoxLayout()
         self.refresh_btn = QtWidgets.QPushButton("Refresh")
         self.load_cache_btn = QtWidgets.QPushButton("Load Cache List")
-        self.load_cache_btn.setStyleSheet("font-weight: bold;")
+        self.load_cache_btn.setObjectName("load_cache_btn")
 
         # Auto-detect button
         self.auto_detect_btn = QtWidgets.QPushButton("Auto-Detect Scene")
         self.auto_detect_btn.setToolTip("Auto-detect shot context from current Maya scene file name")
-        self.auto_detect_btn.setStyleSheet("background-color: #4CAF50; color: white;")
+        self.auto_detect_btn.setObjectName("auto_detect_btn")
 
         btn_layout.addWidget(self.refresh_btn)
         btn_layout.addWidget(self.auto_detect_btn)
@@ -312,15 +831,23 @@ class ShotBuildTab(QtWidgets.QWidget):
         layout.addLayout(nav_layout)
 
         # Assets Table
-        self.assets_table = QtWidgets.QTableWidget(0, 8)
-        self.assets_table.setHorizontalHeaderLabels([
-            "Cache File", "Category", "Name", "Identifier", "Namespace", "Status", "Build", "Update"
-        ])
-        self.assets_table.horizontalHeader().setStretchLastSection(False)
-        self.assets_table.horizontalHeader().setSectionResizeMode(6, QtWidgets.QHeaderView.Fixed)  # Build column fixed width
-        self.assets_table.horizontalHeader().setSectionResizeMode(7, QtWidgets.QHeaderView.Fixed)  # Update column fixed width
-        self.assets_table.setColumnWidth(6, 80)  # Build button column width
-        self.assets_table.setColumnWidth(7, 80)  # Update button width
+        self.assets_model = AssetsModel(self)
+        self.assets_table = QtWidgets.QTableView()
+        self.assets_table.setModel(self.assets_model)
+        self.assets_table.setItemDelegate(AssetsTextDelegate(self.assets_table))
+        self.button_delegate = ButtonDelegate({AssetsModel.BUILD_COL: "#FF9800",
+                                               AssetsModel.UPDATE_COL: "#2196F3"}, self.assets_table)
+        self.assets_table.setItemDelegateForColumn(AssetsModel.BUILD_COL, self.button_delegate)
+        self.assets_table.setItemDelegateForColumn(AssetsModel.UPDATE_COL, self.button_delegate)
+        header = self.assets_table.horizontalHeader()
+        header.setStretchLastSection(False)
+        # Widths are set once instead of measuring every cell after each load;
+        # text columns stay user-resizable (double-click a divider to fit)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.Interactive)
+        header.setSectionResizeMode(AssetsModel.BUILD_COL, QtWidgets.QHeaderView.Fixed)  # Build column fixed width
+        header.setSectionResizeMode(AssetsModel.UPDATE_COL, QtWidgets.QHeaderView.Fixed)  # Update column fixed width
+        for col, width in enumerate(ASSET_COLUMN_WIDTHS):
+            self.assets_table.setColumnWidth(col, width)
         layout.addWidget(self.assets_table, 1)
 
         # Scene Setup Section
@@ -343,7 +870,7 @@ class ShotBuildTab(QtWidgets.QWidget):
         logging_opts_layout = QtWidgets.QHBoxLayout()
         self.verbose_logging_checkbox = QtWidgets.QCheckBox("Verbose Logging")
         self.verbose_logging_checkbox.setToolTip("Enable detailed logging for component referencing and build processes")
-        self.verbose_logging_checkbox.setStyleSheet("font-weight: bold; color: #4CAF50;")
+        self.verbose_logging_checkbox.setObjectName("verbose_logging_checkbox")
         logging_opts_layout.addWidget(self.verbose_logging_checkbox)
         logging_opts_layout.addStretch()
         setup_layout.addLayout(logging_opts_layout)
@@ -356,7 +883,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             "Matrix method: Cleaner scene, better performance, 1 node per link.\n"
             "Constraint method (default): Traditional approach, 2 nodes per link."
         )
-        self.use_matrix_method_checkbox.setStyleSheet("font-weight: bold; color: #2196F3;")
+        self.use_matrix_method_checkbox.setObjectName("use_matrix_method_checkbox")
         self.use_matrix_method_checkbox.setChecked(False)  # Default to constraint method
         place3d_method_layout.addWidget(self.use_matrix_method_checkbox)
         place3d_method_layout.addStretch()
@@ -372,7 +899,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             "  - Instances for all duplicates (sharing geometry & shaders)\n"
             "Result: Faster load times, less memory usage, cleaner scene."
         )
-        self.use_sets_instances_checkbox.setStyleSheet("font-weight: bold; color: #FF9800;")
+        self.use_sets_instances_checkbox.setObjectName("use_sets_instances_checkbox")
         self.use_sets_instances_checkbox.setChecked(False)  # Default to traditional references
         sets_instance_layout.addWidget(self.use_sets_instances_checkbox)
         sets_instance_layout.addStretch()
@@ -384,7 +911,7 @@ class ShotBuildTab(QtWidgets.QWidget):
         # Main build button (all steps)
         main_build_layout = QtWidgets.QHBoxLayout()
         self.build_all_btn = QtWidgets.QPushButton("[START] BUILD ALL STEPS (1-5): Setup + Sets + Assets + Assign + Place3D + BlendShape")
-        self.build_all_btn.setStyleSheet("font-weight: bold; background-color: #2196F3; color: white; padding: 10px; font-size: 14px;")
+        self.build_all_btn.setObjectName("build_all_btn")
         self.build_all_btn.setMinimumHeight(50)
         main_build_layout.addWidget(self.build_all_btn)
         build_layout.addLayout(main_build_layout)
@@ -401,17 +928,17 @@ class ShotBuildTab(QtWidgets.QWidget):
 
         # Subprocess build button
         self.build_subprocess_btn = QtWidgets.QPushButton("[UPDATE] BUILD IN SUBPROCESS & SAVE")
-        self.build_subprocess_btn.setStyleSheet("font-weight: bold; background-color: #9C27B0; color: white; padding: 8px;")
+        self.build_subprocess_btn.setObjectName("build_subprocess_btn")
         subprocess_layout.addWidget(self.build_subprocess_btn)
 
         # Batch build button
         self.batch_build_btn = QtWidgets.QPushButton("[BATCH] BATCH BUILD SHOTS")
-        self.batch_build_btn.setStyleSheet("font-weight: bold; background-color: #FF5722; color: white; padding: 8px;")
+        self.batch_build_btn.setObjectName("batch_build_btn")
         subprocess_layout.addWidget(self.batch_build_btn)
 
         # Update assets button
         self.update_assets_btn = QtWidgets.QPushButton("[UPDATE] UPDATE ASSETS")
-        self.update_assets_btn.setStyleSheet("font-weight: bold; background-color: #FF9800; color: white; padding: 8px;")
+        self.update_assets_btn.setObjectName("update_assets_btn")
         self.update_assets_btn.setToolTip("Update assets from new shot version (only geometry from */publish/{version} paths)")
         subprocess_layout.addWidget(self.update_assets_btn)
 
@@ -423,7 +950,7 @@ class ShotBuildTab(QtWidgets.QWidget):
         self.setup_scene_btn = QtWidgets.QPushButton("Setup Scene")
         self.build_sets_btn = QtWidgets.QPushButton("Build Sets (Step 1)")
         self.build_assets_btn = QtWidgets.QPushButton("Build Assets + Assign + Place3D + BlendShape (Steps 2+3+4)")
-        self.build_assets_btn.setStyleSheet("font-weight: bold; background-color: #4CAF50; color: white;")
+        self.build_assets_btn.setObjectName("build_assets_btn")
         self.assign_shaders_btn = QtWidgets.QPushButton("Assign Shaders Only (Step 3)")
         self.create_blendshapes_btn = QtWidgets.QPushButton("Create BlendShapes Only (Step 4)")
 
@@ -444,6 +971,12 @@ class ShotBuildTab(QtWidgets.QWidget):
         self.log.setMaximumHeight(150)
         layout.addWidget(self.log)
 
+        # Log lines are buffered and appended in one block per flush
+        self._log_buf = []
+        self._log_timer = QtCore.QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.timeout.connect(self._flush_log)
+
     def _wire(self):
         # Connect dropdown change events
         self.root_path_edit.textChanged.connect(self._on_root_changed)
@@ -466,84 +999,176 @@ class ShotBuildTab(QtWidgets.QWidget):
         self.assign_shaders_btn.clicked.connect(self._assign_shaders)
         self.create_blendshapes_btn.clicked.connect(self._create_blendshapes)
 
-        # Initial load
-        self._refresh_projects()
+        # Verbose flag is read on every _log_verbose call; keep a plain bool
+        self.verbose_logging_checkbox.toggled.connect(self._on_verbose_toggled)
 
-        # Auto-detect shot context from current scene on startup
-        self._auto_detect_shot_context()
+        # Per-row Build/Update buttons painted by the table delegate
+        self.button_delegate.clicked.connect(self._on_asset_action)
 
-    def _log(self, msg):
-        """Add message to log."""
-        self.log.appendPlainText(msg)
+        # Initial load, deferred until the window has painted (the share may be slow)
+        self._set_root()
+        QtCore.QTimer.singleShot(0, self._refresh_projects)
+
+        # Auto-detect shot context from current scene on startup (runs after the refresh)
+        QtCore.QTimer.singleShot(0, self._auto_detect_shot_context)
 
-    def _log_verbose(self, msg):
-        """Add message to log only if verbose logging is enabled."""
-        if hasattr(self, 'verbose_logging_checkbox') and self.verbose_logging_checkbox.isChecked():
-            self._log(msg)
+    def _log(self, msg, *args):
+        """Add message to log (flushed to the widget within 50 ms).
+
+        Extra args are str.format'ed into msg, so callers can defer the
+        formatting to the point the line is actually logged.
+        """
+        self._log_buf.append(msg.format(*args) if args else msg)
+        if not self._log_timer.isActive():
+            self._log_timer.start(50)
+
+    def _flush_log(self):
+        """Append buffered log lines as one block: a single relayout and scroll."""
+        if self._log_buf:
+            self.log.appendPlainText("\n".join(self._log_buf))
+            del self._log_buf[:]
+
+    def _log_verbose(self, msg, *args):
+        """Add message to log only if verbose logging is enabled (args formatted lazily)."""
+        if self._verbose:
+            self._log(msg, *args)
+
+    def _on_verbose_toggled(self, checked):
+        self._verbose = checked
+
+    def _set_root(self):
+        self._root = self.root_path_edit.text().strip()
+        self._root_dir = os.path.join(self._root, "") if self._root else ""
 
     def _on_root_changed(self):
         """Handle root path change."""
+        self._set_root()
         self._refresh_projects()
 
+    def _cached_list_dirs(self, path):
+        """_list_directories, remembered per path until the next Refresh."""
+        if path in self._neg_cache:
+            return []
+        dirs = self._dir_cache.get(path)
+        if dirs is None:
+            dirs = _list_directories(path)
+            self._store_dirs(path, dirs)
+        return dirs
+
+    def _store_dirs(self, path, dirs):
+        """Record a listing in the positive or negative directory cache."""
+        if dirs:
+            self._dir_cache[path] = dirs
+        else:
+            self._neg_cache.add(path)
+
+    def _scan_dirs(self, path, combo, found_msg, empty_msg, on_filled):
+        """Fill combo with the subdirectories of path.
+
+        Cached paths are filled at once; anything else is listed on the Qt
+        thread pool so a slow share does not freeze the UI. Only the result of
+        the most recent scan is applied.
+        """
+        self._scan_token += 1
+        if self._sync_scans or path in self._dir_cache or path in self._neg_cache:
+            self._fill_dirs(combo, self._cached_list_dirs(path), found_msg, empty_msg, on_filled)
+            return
+
+        self._scan_target = (combo, found_msg, empty_msg, on_filled)
+        task = _ScanTask(self._scan_token, path, _list_directories)
+        # Bound method of this widget, so the result is queued to the UI thread
+        task.signals.done.connect(self._on_dirs_scanned)
+        self._scan_pool.start(task)
+
+    def _on_dirs_scanned(self, token, path, dirs):
+        """Apply a background listing unless a newer navigation superseded it."""
+        self._store_dirs(path, dirs)
+        if token == self._scan_token:
+            combo, found_msg, empty_msg, on_filled = self._scan_target
+            self._fill_dirs(combo, dirs, found_msg, empty_msg, on_filled)
+
+    def _fill_dirs(self, combo, dirs, found_msg, empty_msg, on_filled):
+        if dirs:
+            self._set_combo_items(combo, dirs)
+            if found_msg:
+                self._log(found_msg.format(len(dirs)))
+            # Signals were blocked while filling; handle the new selection once
+            on_filled()
+        else:
+            self._log(empty_msg)
+
+    def _clear_combos(self, *combos):
+        """Clear combos without each clear() firing currentTextChanged down the chain."""
+        for combo in combos:
+            blocked = combo.blockSignals(True)
+            combo.clear()
+            combo.blockSignals(blocked)
+            self._combo_index.pop(combo, None)
+
+    def _set_combo_items(self, combo, items):
+        """Replace a combo's items with signals blocked; the caller handles the new selection."""
+        blocked = combo.blockSignals(True)
+        combo.clear()
+        combo.addItems(items)
+        combo.blockSignals(blocked)
+        self._combo_index[combo] = dict((text, i) for i, text in enumerate(items))
+
+    def _combo_find(self, combo, text):
+        """combo.findText(text) from the index kept by _set_combo_items."""
+        return self._combo_index.get(combo, {}).get(text, -1)
+
     def _refresh_projects(self):
         """Refresh project list - reverted to synchronous for reliability."""
-        root = self.root_path_edit.text().strip()
+        _clear_stat_cache()
+        self._dir_cache.clear()
+        self._neg_cache.clear()
+        root = self._root
         if not root:
             return
 
-        self.project_combo.clear()
         projects = _list_directories(root)
+        self._set_combo_items(self.project_combo, projects)
         if projects:
-            self.project_combo.addItems(projects)
             self._log("Found {} projects in {}".format(len(projects), root))
         else:
             self._log("No projects found in {}".format(root))
+        self._on_project_changed()
 
     def _on_project_changed(self):
         """Handle project selection change."""
-        self.episode_combo.clear()
-        self.sequence_combo.clear()
-        self.shot_combo.clear()
-        self.version_combo.clear()
+        self._clear_combos(self.episode_combo, self.sequence_combo, self.shot_combo, self.version_combo)
 
         project = self.project_combo.currentText()
         if not project:
             return
 
-        root = self.root_path_edit.text().strip()
-        scene_path = os.path.join(root, project, "all", "scene")
+        root = self._root_dir
+        scene_path = root + project + "/all/scene"
 
-        episodes = _list_directories(scene_path)
-        if episodes:
-            self.episode_combo.addItems(episodes)
-            self._log("Found {} episodes in {}".format(len(episodes), project))
-        else:
-            self._log("No episodes found in {}".format(project))
+        self._scan_dirs(scene_path, self.episode_combo,
+                        "Found {} episodes in " + project,
+                        "No episodes found in {}".format(project),
+                        self._on_episode_changed)
 
     def _on_episode_changed(self):
         """Handle episode selection change."""
-        self.sequence_combo.clear()
-        self.shot_combo.clear()
-        self.version_combo.clear()
+        self._clear_combos(self.sequence_combo, self.shot_combo, self.version_combo)
 
         project = self.project_combo.currentText()
         episode = self.episode_combo.currentText()
         if not project or not episode:
             return
 
-        root = self.root_path_edit.text().strip()
-        ep_path = os.path.join(root, project, "all", "scene", episode)
+        root = self._root_dir
+        ep_path = root + project + "/all/scene/" + episode
 
-        sequences = _list_directories(ep_path)
-        if sequences:
-            self.sequence_combo.addItems(sequences)
-        else:
-            self._log("No sequences found in {}/{}".format(project, episode))
+        self._scan_dirs(ep_path, self.sequence_combo, None,
+                        "No sequences found in {}/{}".format(project, episode),
+                        self._on_sequence_changed)
 
     def _on_sequence_changed(self):
         """Handle sequence selection change."""
-        self.shot_combo.clear()
-        self.version_combo.clear()
+        self._clear_combos(self.shot_combo, self.version_combo)
 
         project = self.project_combo.currentText()
         episode = self.episode_combo.currentText()
@@ -551,14 +1176,12 @@ class ShotBuildTab(QtWidgets.QWidget):
         if not all([project, episode, sequence]):
             return
 
-        root = self.root_path_edit.text().strip()
-        seq_path = os.path.join(root, project, "all", "scene", episode, sequence)
+        root = self._root_dir
+        seq_path = root + project + "/all/scene/" + episode + "/" + sequence
 
-        shots = _list_directories(seq_path)
-        if shots:
-            self.shot_combo.addItems(shots)
-        else:
-            self._log("No shots found in {}/{}/{}".format(project, episode, sequence))
+        self._scan_dirs(seq_path, self.shot_combo, None,
+                        "No shots found in {}/{}/{}".format(project, episode, sequence),
+                        self._on_shot_changed)
 
     def _on_shot_changed(self):
         """Handle shot selection change."""
@@ -571,17 +1194,34 @@ class ShotBuildTab(QtWidgets.QWidget):
         if not all([project, episode, sequence, shot]):
             return
 
-        root = self.root_path_edit.text().strip()
-        version_path = os.path.join(root, project, "all", "scene", episode, sequence, shot, "anim", "publish")
+        root = self._root_dir
+        version_path = _SCENE_TPL.format(root=root, project=project, episode=episode,
+                                         sequence=sequence, shot=shot)
+
+        self._scan_token += 1
+        if self._sync_scans:
+            self._fill_versions(version_path, _list_versions(version_path))
+            return
+
+        # Versions are not cached (new publishes land here); list them off the UI thread
+        task = _ScanTask(self._scan_token, version_path, _list_versions)
+        task.signals.done.connect(self._on_versions_scanned)
+        self._scan_pool.start(task)
 
-        versions = _list_versions(version_path)
+    def _on_versions_scanned(self, token, version_path, versions):
+        """Apply a background version listing unless the shot selection moved on."""
+        if token == self._scan_token:
+            self._fill_versions(version_path, versions)
+
+    def _fill_versions(self, version_path, versions):
         if versions:
-            self.version_combo.addItems(versions)
+            self._set_combo_items(self.version_combo, versions)
         else:
-            self._log("No versions found for {}/{}/{}/{}".format(project, episode, sequence, shot))
+            self._log("No versions found in {}".format(version_path))
 
     def _load_cache_list(self):
         """Load and parse cache files from selected shot/version."""
+        _clear_stat_cache()
         project = self.project_combo.currentText()
         episode = self.episode_combo.currentText()
         sequence = self.sequence_combo.currentText()
@@ -592,8 +1232,9 @@ class ShotBuildTab(QtWidgets.QWidget):
             self._log("[ERROR] Please select project, episode, sequence, shot, and version")
             return
 
-        root = self.root_path_edit.text().strip()
-        cache_path = os.path.join(root, project, "all", "scene", episode, sequence, shot, "anim", "publish", version)
+        root = self._root_dir
+        cache_path = _SCENE_TPL.format(root=root, project=project, episode=episode,
+                                       sequence=sequence, shot=shot) + "/" + version
 
         if not _validate_directory(cache_path):
             self._log("[ERROR] Cache directory does not exist: {}".format(cache_path))
@@ -601,22 +1242,36 @@ class ShotBuildTab(QtWidgets.QWidget):
 
         self.current_shot_path = cache_path
         self.assets_data = []
+        self._assets_by_category = {}
+        self._asset_lookup_cache.clear()
+        self._expected_namespaces = frozenset()
 
         # List all .abc files
         try:
             files = [f for f in os.listdir(cache_path) if f.endswith('.abc')]
             self._log("Found {} cache files in {}".format(len(files), cache_path))
 
-            # Parse each file
-            for filename in files:
-                parsed = _parse_cache_filename(filename)
-                if parsed:
-                    parsed['filename'] = filename
-                    parsed['full_path'] = os.path.join(cache_path, filename)
-                    self.assets_data.append(parsed)
-                else:
+            # Parse every file in one pass (one precompiled match per name)
+            parsed_files = [(filename, _parse_cache_filename(filename)) for filename in files]
+            prefix = os.path.join(cache_path, "")
+            self.assets_data = [dict(parsed._asdict(), filename=filename, full_path=prefix + filename)
+                                for filename, parsed in parsed_files if parsed]
+            for filename, parsed in parsed_files:
+                if not parsed:
                     self._log("[WARNING] Could not parse filename: {}".format(filename))
 
+            # Namespaces these assets reference (geometry, shader and CHAR groom),
+            # and the per-category index the build steps filter with
+            expected = set()
+            by_category = self._assets_by_category
+            for asset in self.assets_data:
+                by_category.setdefault(asset['category'], []).append(asset)
+                expected.add(asset['namespace'])
+                expected.add(asset['namespace'] + "_shade")
+                if asset['category'] == 'CHAR':
+                    expected.add(asset['namespace'] + "_groom")
+            self._expected_namespaces = frozenset(expected)
+
             self._populate_assets_table()
             self._log("Parsed {} valid assets from cache files".format(len(self.assets_data)))
 
@@ -625,33 +1280,7 @@ class ShotBuildTab(QtWidgets.QWidget):
 
     def _populate_assets_table(self):
         """Populate the assets table with parsed data."""
-        self.assets_table.setRowCount(0)
-
-        for i, asset in enumerate(self.assets_data):
-            row = self.assets_table.rowCount()
-            self.assets_table.insertRow(row)
-
-            self.assets_table.setItem(row, 0, QtWidgets.QTableWidgetItem(asset['filename']))
-            self.assets_table.setItem(row, 1, QtWidgets.QTableWidgetItem(asset['category']))
-            self.assets_table.setItem(row, 2, QtWidgets.QTableWidgetItem(asset['name']))
-            self.assets_table.setItem(row, 3, QtWidgets.QTableWidgetItem(asset['identifier']))
-            self.assets_table.setItem(row, 4, QtWidgets.QTableWidgetItem(asset['namespace']))
-            self.assets_table.setItem(row, 5, QtWidgets.QTableWidgetItem("Ready"))
-
-            # Add build button
-            build_btn = QtWidgets.QPushButton("Build")
-            build_btn.setStyleSheet("background-color: #FF9800; color: white; font-weight: bold;")
-            build_btn.clicked.connect(lambda checked=False, idx=i: self._build_single_asset(idx))
-            self.assets_table.setCellWidget(row, 6, build_btn)
-
-            # Add update button
-            update_btn = QtWidgets.QPushButton("Update")
-            update_btn.setStyleSheet("background-color: #2196F3; color: white; font-weight: bold;")
-            update_btn.setToolTip("Update this asset from new version (only geometry from */publish/{version} paths)")
-            update_btn.clicked.connect(lambda checked=False, idx=i: self._update_single_asset(idx))
-            self.assets_table.setCellWidget(row, 7, update_btn)
-
-        self.assets_table.resizeColumnsToContents()
+        self.assets_model.set_assets(self.assets_data)
 
     def _setup_scene(self):
         """Setup scene with enhanced user choice for current vs new scene."""
@@ -742,40 +1371,45 @@ class ShotBuildTab(QtWidgets.QWidget):
         )
 
         if result == "Yes":
-            # Remove all references
-            refs = cmds.ls(type="reference") or []
-            for ref in refs:
-                if ref != "sharedReferenceNode":
+            # Remove all references in one undo chunk, without viewport redraws
+            refs = [ref for ref in (cmds.ls(type="reference") or []) if ref != "sharedReferenceNode"]
+            removed = []
+            failed = []
+            cmds.undoInfo(openChunk=True)
+            cmds.refresh(suspend=True)
+            try:
+                for ref in refs:
                     try:
                         cmds.file(removeReference=True, referenceNode=ref)
-                        self._log("Removed reference: {}".format(ref))
+                        removed.append(ref)
                     except Exception as e:
-                        self._log("[ERROR] Failed to remove reference {}: {}".format(ref, str(e)))
+                        failed.append("{} ({})".format(ref, str(e)))
 
-            self._create_scene_groups()
+                self._create_scene_groups()
+            finally:
+                cmds.refresh(suspend=False)
+                cmds.undoInfo(closeChunk=True)
+
+            if removed:
+                self._log("Removed {} references: {}".format(len(removed), ", ".join(removed)))
+            if failed:
+                self._log("[ERROR] Failed to remove {} references: {}".format(len(failed), "; ".join(failed)))
             self._log("[SETUP] Removed all references and created asset groups")
 
     def _create_scene_groups(self):
         """Create predefined asset groups."""
-        groups = ["Camera_Grp", "Character_Grp", "Setdress_Grp", "Props_Grp", "Sets_Grp", "Dressing_Grp"]
-
-        for grp_name in groups:
-            if not cmds.objExists(grp_name):
+        existing = _existing_nodes(_SCENE_GROUPS)
+        for grp_name in _SCENE_GROUPS:
+            if grp_name not in existing:
                 grp = cmds.group(empty=True, name=grp_name)
                 self._log("Created group: {}".format(grp))
 
     def _check_scene_state(self):
         """Check current scene state for groups and references matching current shot."""
         # Check standard groups
-        standard_groups = ["Camera_Grp", "Character_Grp", "Setdress_Grp", "Props_Grp", "Sets_Grp", "Dressing_Grp"]
-        existing_groups = []
-        missing_groups = []
-
-        for grp in standard_groups:
-            if cmds.objExists(grp):
-                existing_groups.append(grp)
-            else:
-                missing_groups.append(grp)
+        existing = _existing_nodes(_SCENE_GROUPS)
+        existing_groups = [grp for grp in _SCENE_GROUPS if grp in existing]
+        missing_groups = [grp for grp in _SCENE_GROUPS if grp not in existing]
 
         # Check references matching current shot assets
         matching_references = self._get_current_shot_references()
@@ -795,25 +1429,28 @@ class ShotBuildTab(QtWidgets.QWidget):
             return []
 
         matching_refs = []
-        all_refs = cmds.ls(type="reference") or []
 
-        # Get expected namespaces from current shot assets
-        expected_namespaces = set()
-        for asset in self.assets_data:
-            expected_namespaces.add(asset['namespace'])
-            # Also add shader and groom namespaces
-            expected_namespaces.add(asset['namespace'] + "_shade")
-            if asset['category'] == 'CHAR':
-                expected_namespaces.add(asset['namespace'] + "_groom")
+        expected_namespaces = self._expected_namespaces
 
+        # One namespace listing tells which expected namespaces are in the scene;
+        # only those need their reference node found
+        scene_namespaces = cmds.namespaceInfo(':', listOnlyNamespaces=True, recurse=True) or []
+        present = expected_namespaces.intersection(ns.lstrip(':') for ns in scene_namespaces)
+        if not present:
+            return []
+
+        all_refs = cmds.ls(type="reference") or []
         for ref in all_refs:
             if ref == "sharedReferenceNode":
                 continue
             try:
                 # Get namespace associated with this reference
                 ref_namespace = cmds.referenceQuery(ref, namespace=True)
-                if ref_namespace and ref_namespace.lstrip(':') in expected_namespaces:
+                if ref_namespace and ref_namespace.lstrip(':') in present:
                     matching_refs.append(ref)
+                    # Each namespace belongs to a single reference
+                    if len(matching_refs) == len(present):
+                        break
             except Exception:
                 continue
 
@@ -832,11 +1469,6 @@ class ShotBuildTab(QtWidgets.QWidget):
             else:  # build context
                 message = "Build shot in current scene or new scene?"
 
-        try:
-            from PySide2 import QtWidgets
-        except ImportError:
-            from PySide6 import QtWidgets
-
         msg = QtWidgets.QMessageBox()
         msg.setWindowTitle("Scene Choice")
         msg.setText(message)
@@ -899,40 +1531,19 @@ class ShotBuildTab(QtWidgets.QWidget):
     def _parse_context_from_path(self, scene_path):
         """Parse context from file path structure."""
         try:
-            # Normalize path separators
+            # Normalize path separators; look for .../scene/Ep01/sq0010/SH0020/...
             normalized_path = scene_path.replace('\\', '/')
-            parts = normalized_path.split('/')
-
-            # Look for scene directory structure: .../scene/Ep01/sq0010/SH0020/...
-            scene_index = -1
-            for i, part in enumerate(parts):
-                if part.lower() == 'scene':
-                    scene_index = i
-                    break
-
-            if scene_index >= 0 and len(parts) > scene_index + 3:
-                # Extract project (directory before 'all')
-                project = None
-                for i in range(scene_index - 1, -1, -1):
-                    if parts[i] == 'all' and i > 0:
-                        project = parts[i - 1]
-                        break
-
-                episode = parts[scene_index + 1]  # Ep01
-                sequence = parts[scene_index + 2]  # sq0010
-                shot = parts[scene_index + 3]      # SH0020
-
-                # Validate format
-                if (episode.startswith('Ep') and
-                    sequence.startswith('sq') and
-                    shot.startswith('SH')):
-                    return {
-                        'project': project,
-                        'episode': episode,
-                        'sequence': sequence,
-                        'shot': shot,
-                        'source': 'path'
-                    }
+            match = _SCENE_PATH_RE.search(normalized_path)
+            if match:
+                # Project is the directory before the nearest 'all' above 'scene'
+                projects = _PROJECT_DIR_RE.findall(normalized_path, 0, match.start() + 1)
+                return {
+                    'project': projects[-1] if projects else None,
+                    'episode': match.group(1),   # Ep01
+                    'sequence': match.group(2),  # sq0010
+                    'shot': match.group(3),      # SH0020
+                    'source': 'path'
+                }
         except Exception:
             pass
         return None
@@ -940,31 +1551,21 @@ class ShotBuildTab(QtWidgets.QWidget):
     def _parse_context_from_filename(self, scene_path):
         """Parse context from filename using regex patterns."""
         try:
-            import re
-            filename = os.path.basename(scene_path)
-
             # Pattern: Ep01_sq0010_SH0020_lighting_v001.ma
-            pattern = r'(?:^|_)(Ep\d+).*?[_-](sq\d+).*?[_-](SH\d+)'
-            match = re.search(pattern, filename, re.IGNORECASE)
-
-            if match:
-                episode = match.group(1)
-                sequence = match.group(2)
-                shot = match.group(3)
+            filename = os.path.basename(scene_path)
+            tokens = _split_shot_tokens(filename)
+            if not tokens:
+                match = _SCENE_FILE_RE.search(filename)
+                tokens = match.groups() if match else None
 
+            if tokens:
                 # Try to extract project from path
-                project = None
-                path_parts = scene_path.replace('\\', '/').split('/')
-                for i, part in enumerate(path_parts):
-                    if part.lower() == 'all' and i > 0:
-                        project = path_parts[i - 1]
-                        break
-
+                project = _PROJECT_DIR_ANYCASE_RE.search(scene_path.replace('\\', '/'))
                 return {
-                    'project': project,
-                    'episode': episode,
-                    'sequence': sequence,
-                    'shot': shot,
+                    'project': project.group(1) if project else None,
+                    'episode': tokens[0],
+                    'sequence': tokens[1],
+                    'shot': tokens[2],
                     'source': 'filename'
                 }
         except Exception:
@@ -973,6 +1574,8 @@ class ShotBuildTab(QtWidgets.QWidget):
 
     def _set_dropdowns_from_context(self, context):
         """Set dropdown selections based on detected context."""
+        # Each level must be populated before the next one can be selected
+        self._sync_scans = True
         try:
             project = context.get('project')
             episode = context.get('episode')
@@ -985,7 +1588,7 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             # Set project if detected and exists in dropdown
             if project:
-                project_index = self.project_combo.findText(project)
+                project_index = self._combo_find(self.project_combo, project)
                 if project_index >= 0:
                     self.project_combo.setCurrentIndex(project_index)
                     self._log("[AUTO-DETECT] Set project: {}".format(project))
@@ -997,7 +1600,7 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             # Set episode if detected and exists in dropdown
             if episode:
-                episode_index = self.episode_combo.findText(episode)
+                episode_index = self._combo_find(self.episode_combo, episode)
                 if episode_index >= 0:
                     self.episode_combo.setCurrentIndex(episode_index)
                     self._log("[AUTO-DETECT] Set episode: {}".format(episode))
@@ -1009,7 +1612,7 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             # Set sequence if detected and exists in dropdown
             if sequence:
-                sequence_index = self.sequence_combo.findText(sequence)
+                sequence_index = self._combo_find(self.sequence_combo, sequence)
                 if sequence_index >= 0:
                     self.sequence_combo.setCurrentIndex(sequence_index)
                     self._log("[AUTO-DETECT] Set sequence: {}".format(sequence))
@@ -1021,7 +1624,7 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             # Set shot if detected and exists in dropdown
             if shot:
-                shot_index = self.shot_combo.findText(shot)
+                shot_index = self._combo_find(self.shot_combo, shot)
                 if shot_index >= 0:
                     self.shot_combo.setCurrentIndex(shot_index)
                     self._log("[AUTO-DETECT] Set shot: {}".format(shot))
@@ -1038,6 +1641,8 @@ class ShotBuildTab(QtWidgets.QWidget):
 
         except Exception as e:
             self._log("[AUTO-DETECT] Failed to set dropdowns: {}".format(str(e)))
+        finally:
+            self._sync_scans = False
 
     def _build_sets(self):
         """Build Sets assets first - Step 1."""
@@ -1045,11 +1650,15 @@ class ShotBuildTab(QtWidgets.QWidget):
             self._log("[ERROR] No assets loaded. Please load cache list first.")
             return
 
-        sets_assets = [asset for asset in self.assets_data if asset['category'] == 'SETS']
+        sets_assets = self._assets_by_category.get('SETS', [])
         if not sets_assets:
             self._log("[INFO] No SETS assets found in cache list.")
             return
 
+        # Asset folders may have changed since the last build
+        _clear_stat_cache()
+        self._asset_lookup_cache.clear()
+
         # Check if instance optimization is enabled
         use_instances = self.use_sets_instances_checkbox.isChecked()
 
@@ -1064,22 +1673,16 @@ class ShotBuildTab(QtWidgets.QWidget):
 
     def _build_sets_with_instances(self, sets_assets):
         """Build Sets using instance optimization (1 reference + instances for duplicates)."""
-        try:
-            # Import the instance builder module
-            from . import sets_instance_builder
-        except ImportError:
-            try:
-                import sets_instance_builder
-            except ImportError:
-                self._log("[ERROR] Could not import sets_instance_builder module")
-                self._log("[FALLBACK] Using traditional reference method...")
-                self._build_sets_traditional(sets_assets)
-                return
+        if _sets_instance_builder is None:
+            self._log("[ERROR] Could not import sets_instance_builder module")
+            self._log("[FALLBACK] Using traditional reference method...")
+            self._build_sets_traditional(sets_assets)
+            return
 
         root = self.root_path_edit.text().strip()
         project = self.project_combo.currentText()
 
-        builder = sets_instance_builder.SetsInstanceBuilder(
+        builder = _sets_instance_builder.SetsInstanceBuilder(
             root, project, log_callback=self._log
         )
 
@@ -1126,7 +1729,7 @@ class ShotBuildTab(QtWidgets.QWidget):
                 try:
                     # Set current namespace so import goes into it automatically
                     cmds.namespace(setNamespace=namespace)
-                    self._log("Set current namespace to: {}".format(namespace))
+                    self._log_verbose("Set current namespace to: {}", namespace)
 
                     # Import the alembic file (will go into current namespace)
                     cmds.AbcImport(cache_file, mode="import", fitTimeRange=False)
@@ -1135,7 +1738,7 @@ class ShotBuildTab(QtWidgets.QWidget):
                 finally:
                     # Always restore original namespace
                     cmds.namespace(setNamespace=current_ns)
-                    self._log("Restored namespace to: {}".format(current_ns))
+                    self._log_verbose("Restored namespace to: {}", current_ns)
 
                 # Find locators in the namespace (should all be there now)
                 all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform") or []
@@ -1144,21 +1747,14 @@ class ShotBuildTab(QtWidgets.QWidget):
                 # If no locators found in namespace, try fallback search
                 if not all_locators:
                     self._log("[WARNING] No locators found in namespace, trying fallback search...")
-                    all_locator_shapes = cmds.ls(type="locator") or []
-                    fallback_locators = []
-
-                    for loc_shape in all_locator_shapes:
-                        loc_transforms = cmds.listRelatives(loc_shape, parent=True, fullPath=True) or []
-                        for loc_transform in loc_transforms:
-                            if loc_transform.endswith("_Loc"):
-                                fallback_locators.append(loc_transform)
-
-                    all_locators = fallback_locators
+                    all_locators = _scene_loc_transforms()
                     self._log("Found {} locators in fallback search: {}".format(len(all_locators), all_locators))
 
                 # Process each locator
+                root = self.root_path_edit.text().strip()
+                project = self.project_combo.currentText()
                 for loc in all_locators:
-                    self._process_sets_locator(loc, namespace)
+                    self._process_sets_locator(loc, namespace, root, project)
 
                 # Move to Sets group
                 sets_group = self._get_group_for_category("SETS")
@@ -1175,211 +1771,166 @@ class ShotBuildTab(QtWidgets.QWidget):
             except Exception as e:
                 self._log("[ERROR] Failed to build SETS asset {}: {}".format(asset['filename'], str(e)))
 
-    def _process_sets_locator(self, locator, set_namespace):
-        """Process individual Sets locator for asset placement."""
-        try:
-            # Extract component name from locator
-            # Format: SETS_KitBedRoomInt_001:KBDIntCelling_001_Loc
-            loc_short = _short(locator)  # KBDIntCelling_001_Loc
-            if not loc_short.endswith("_Loc"):
-                self._log("[WARNING] Locator doesn't end with _Loc: {}".format(locator))
-                return
-
-            # Extract component name: KBDIntCelling_001_Loc -> KBDIntCelling
-            component_parts = loc_short.replace("_Loc", "").split("_")
-            if len(component_parts) < 2:
-                self._log("[WARNING] Invalid locator name format: {}".format(locator))
-                return
+    def _resolve_component_asset(self, locator, set_namespace, root=None, project=None,
+                                 label="Processing locator"):
+        """Resolve a Sets locator to its component asset files and namespace.
+
+        Returns a dict with component_name, component_id, geo_file,
+        shader_file and full_component_ns, or None if the locator name is
+        invalid or no asset was found.
+        """
+        # Extract component name from locator
+        # Format: SETS_KitBedRoomInt_001:KBDIntCelling_001_Loc
+        loc_short = _short(locator)  # KBDIntCelling_001_Loc
+        if loc_short[-4:] != "_Loc":
+            self._log("[WARNING] Locator doesn't end with _Loc: {}".format(locator))
+            return None
 
-            component_name = "_".join(component_parts[:-1])  # KBDIntCelling (remove _001)
-            component_id = component_parts[-1]  # 001
+        # Extract component name: KBDIntCelling_001_Loc -> KBDIntCelling, 001
+        component_name, sep, component_id = loc_short[:-4].rpartition("_")  # suffix checked above
+        if not sep or not component_name:
+            self._log("[WARNING] Invalid locator name format: {}".format(locator))
+            return None
 
-            self._log("Processing locator: {} -> component: {}, id: {}".format(locator, component_name, component_id))
-            self._log_verbose("  Locator full path: {}".format(locator))
-            self._log_verbose("  Component name extracted: {}".format(component_name))
-            self._log_verbose("  Component ID extracted: {}".format(component_id))
+        self._log("{}: {} -> component: {}, id: {}".format(label, locator, component_name, component_id))
+        if self._verbose:
+            self._log("  Locator full path: {}".format(locator))
+            self._log("  Component name extracted: {}".format(component_name))
+            self._log("  Component ID extracted: {}".format(component_id))
 
-            # Build paths for geometry and shader - comprehensive search approach
+        # Build paths for geometry and shader - comprehensive search approach
+        # Callers looping over locators pass root/project read once per build
+        if root is None:
             root = self.root_path_edit.text().strip()
+        if project is None:
             project = self.project_combo.currentText()
 
-            # Search locations in priority order:
-            # 1. Setdress/interior, 2. Setdress/exterior, 3. Props/object
-            search_locations = [
-                ("Setdress", "interior"),
-                ("Setdress", "exterior"),
-                ("Props", "object")
-            ]
+        # Search locations in priority order:
+        # 1. Setdress/interior, 2. Setdress/exterior, 3. Props/object
+        search_locations = [
+            ("Setdress", "interior"),
+            ("Setdress", "exterior"),
+            ("Props", "object")
+        ]
 
-            self._log_verbose("  Searching for component '{}' in asset directories...".format(component_name))
+        self._log_verbose("  Searching for component '{}' in asset directories...", component_name)
 
-            geo_file = None
-            shader_file = None
-            asset_category = None
-            asset_subdir = None
+        geo_file = None
+        shader_file = None
+        asset_category = None
+        asset_subdir = None
 
-            # Search all possible locations
+        # Loop invariants: asset root and file names
+        asset_root = os.path.join(root, project, "all", "asset")
+        geo_name = "{}_geo.abc".format(component_name)
+        shade_name = "{}_rsshade.ma".format(component_name)
+        _exists = os.path.exists
+
+        # Same component on many locators: resolve each one once per build
+        cache_key = (asset_root, component_name)
+        cached = self._asset_lookup_cache.get(cache_key)
+        if cached is not None:
+            geo_file, shader_file, asset_category, asset_subdir = cached
+        else:
+            # Probe every location at once (network stats overlap), then
+            # take the first hit in priority order
+            probes = []
             for category, subdir in search_locations:
-                base_path = os.path.join(root, project, "all", "asset", category, subdir, component_name, "hero")
-                test_geo_file = os.path.join(base_path, "{}_geo.abc".format(component_name))
-                test_shader_file = os.path.join(base_path, "{}_rsshade.ma".format(component_name))
+                base_path = os.path.join(asset_root, category, subdir, component_name, "hero")
+                test_geo_file = os.path.join(base_path, geo_name)
+                # Locations whose folder listing lacks the component are not probed
+                probe = None
+                if component_name in _dir_set(os.path.join(asset_root, category, subdir)):
+                    probe = _submit_probe(_cached_exists, test_geo_file)
+                probes.append((category, subdir, base_path, test_geo_file, probe))
+
+            # Search all possible locations
+            for category, subdir, base_path, test_geo_file, probe in probes:
+                test_shader_file = os.path.join(base_path, shade_name)
 
-                self._log_verbose("    Checking {}/{}: {}".format(category, subdir, base_path))
-                self._log_verbose("      Geometry: {}".format(test_geo_file))
-                self._log_verbose("      Shader: {}".format(test_shader_file))
+                if self._verbose:
+                    self._log("    Checking {}/{}: {}".format(category, subdir, base_path))
+                    self._log("      Geometry: {}".format(test_geo_file))
+                    self._log("      Shader: {}".format(test_shader_file))
 
-                if os.path.exists(test_geo_file):
+                if probe is not None and probe.result():
                     geo_file = test_geo_file
                     shader_file = test_shader_file
                     asset_category = category
                     asset_subdir = subdir
                     self._log("Found asset in {}/{} directory: {}".format(category, subdir, component_name))
-                    self._log_verbose("      [OK] Found geometry file: {}".format(test_geo_file))
-                    self._log_verbose("      [OK] Shader file exists: {}".format(os.path.exists(test_shader_file)))
+                    if self._verbose:
+                        self._log("      [OK] Found geometry file: {}".format(test_geo_file))
+                        self._log("      [OK] Shader file exists: {}".format(_exists(test_shader_file)))
                     break
                 else:
                     self._log_verbose("      [FAIL] Geometry file not found")
+            self._asset_lookup_cache[cache_key] = (geo_file, shader_file, asset_category, asset_subdir)
 
-            # Check if asset was found
-            if not geo_file:
-                self._log("[ERROR] Asset not found in any directory: {}".format(component_name))
-                for category, subdir in search_locations:
-                    test_path = os.path.join(root, project, "all", "asset", category, subdir, component_name, "hero", "{}_geo.abc".format(component_name))
-                    self._log("Checked {}/{}: {}".format(category, subdir, test_path))
-                return
-
-            self._log("Using {}/{} asset: {}".format(asset_category, asset_subdir, component_name))
-            self._log_verbose("  Geometry file: {}".format(geo_file))
-            self._log_verbose("  Shader file: {}".format(shader_file))
-
-            # Create nested namespace for this component
-            component_namespace = "{}_{}".format(component_name, component_id)  # KBDIntCelling_001
-            full_component_ns = "{}:{}".format(set_namespace, component_namespace)  # SETS_KitBedRoomInt_001:KBDIntCelling_001
-
-            self._log_verbose("  Creating component namespace: {}".format(component_namespace))
-            self._log_verbose("  Full component namespace: {}".format(full_component_ns))
-
-            # Reference geometry if exists
-            if os.path.exists(geo_file):
-                try:
-                    self._log_verbose("  Referencing geometry file...")
-                    cmds.file(geo_file, reference=True, namespace=full_component_ns)
-                    self._log("Referenced geometry: {} -> {}".format(geo_file, full_component_ns))
-
-                    # Find top-level transform in the referenced geometry
-                    ref_nodes = cmds.ls("{}:*".format(full_component_ns), type="transform") or []
-                    top_level_nodes = []
-
-                    for node in ref_nodes:
-                        # Check if this node has no parent (except world)
-                        parents = cmds.listRelatives(node, parent=True, fullPath=True) or []
-                        if not parents or parents[0] == "|":
-                            top_level_nodes.append(node)
-
-                    # Parent top-level nodes to locator (move object, not preserve position)
-                    for top_node in top_level_nodes:
-                        try:
-                            self._log_verbose("    Parenting {} to locator {}".format(top_node, locator))
-                            cmds.parent(top_node, locator)
-                            self._log("Parented {} to locator {}".format(top_node, locator))
-
-                            # Reset top-level transform to origin (TR=0, Scale=1)
-                            cmds.xform(top_node, translation=[0, 0, 0], rotation=[0, 0, 0])
-                            cmds.xform(top_node, scale=[1, 1, 1])
-                            self._log("Reset {} transform to origin".format(top_node))
-
-                        except Exception as e:
-                            self._log("[WARNING] Could not parent/reset {}: {}".format(top_node, str(e)))
-
-                except Exception as e:
-                    self._log("[ERROR] Failed to reference geometry {}: {}".format(geo_file, str(e)))
-            else:
-                self._log("[WARNING] Geometry file not found: {}".format(geo_file))
+        # Check if asset was found
+        if not geo_file:
+            self._log("[ERROR] Asset not found in any directory: {}".format(component_name))
+            for category, subdir in search_locations:
+                test_path = os.path.join(asset_root, category, subdir, component_name, "hero", geo_name)
+                self._log("Checked {}/{}: {}".format(category, subdir, test_path))
+            return None
 
-            # Reference shader if exists
-            if os.path.exists(shader_file):
-                try:
-                    shader_ns = "{}_shade".format(full_component_ns)  # SETS_KitBedRoomInt_001:KBDIntCelling_001_shade
-                    self._log_verbose("  Referencing shader file...")
-                    self._log_verbose("  Shader namespace: {}".format(shader_ns))
-                    cmds.file(shader_file, reference=True, namespace=shader_ns)
-                    self._log("Referenced shader: {} -> {}".format(shader_file, shader_ns))
+        self._log("Using {}/{} asset: {}".format(asset_category, asset_subdir, component_name))
+        if self._verbose:
+            self._log("  Geometry file: {}".format(geo_file))
+            self._log("  Shader file: {}".format(shader_file))
 
-                    # Assign shaders to geometry
-                    self._assign_component_shaders(full_component_ns, shader_ns)
+        # Create nested namespace for this component
+        component_namespace = "{}_{}".format(component_name, component_id)  # KBDIntCelling_001
+        full_component_ns = "{}:{}".format(set_namespace, component_namespace)  # SETS_KitBedRoomInt_001:KBDIntCelling_001
 
-                except Exception as e:
-                    self._log("[ERROR] Failed to reference shader {}: {}".format(shader_file, str(e)))
-            else:
-                self._log("[WARNING] Shader file not found: {}".format(shader_file))
+        if self._verbose:
+            self._log("  Creating component namespace: {}".format(component_namespace))
+            self._log("  Full component namespace: {}".format(full_component_ns))
 
-        except Exception as e:
-            self._log("[ERROR] Failed to process locator {}: {}".format(locator, str(e)))
+        return {
+            "component_name": component_name,
+            "component_id": component_id,
+            "geo_file": geo_file,
+            "shader_file": shader_file,
+            "full_component_ns": full_component_ns,
+        }
 
-    def _process_sets_locator_with_conflict_check(self, locator, set_namespace):
-        """Process Sets locator with conflict checking and user choice for existing references."""
+    def _process_sets_locator(self, locator, set_namespace, root=None, project=None):
+        """Process individual Sets locator for asset placement."""
         try:
-            # Extract component name from locator
-            loc_short = _short(locator)  # KBDIntCelling_001_Loc
-            if not loc_short.endswith("_Loc"):
-                self._log("[WARNING] Locator doesn't end with _Loc: {}".format(locator))
+            resolved = self._resolve_component_asset(locator, set_namespace, root, project)
+            if resolved is None:
                 return
 
-            # Extract component name: KBDIntCelling_001_Loc -> KBDIntCelling
-            component_parts = loc_short.replace("_Loc", "").split("_")
-            if len(component_parts) < 2:
-                self._log("[WARNING] Invalid locator name format: {}".format(locator))
-                return
+            self._import_component_geometry_and_shader(
+                locator, resolved["full_component_ns"], resolved["geo_file"], resolved["shader_file"])
 
-            component_name = "_".join(component_parts[:-1])  # KBDIntCelling (remove _001)
-            component_id = component_parts[-1]  # 001
-
-            self._log("Processing locator with conflict check: {} -> component: {}, id: {}".format(locator, component_name, component_id))
-
-            # Build paths for geometry and shader - comprehensive search approach
-            root = self.root_path_edit.text().strip()
-            project = self.project_combo.currentText()
-
-            # Search locations in priority order:
-            # 1. Setdress/interior, 2. Setdress/exterior, 3. Props/object
-            search_locations = [
-                ("Setdress", "interior"),
-                ("Setdress", "exterior"),
-                ("Props", "object")
-            ]
-
-            geo_file = None
-            shader_file = None
-            asset_category = None
-            asset_subdir = None
+        except Exception as e:
+            self._log("[ERROR] Failed to process locator {}: {}".format(locator, str(e)))
 
-            # Search all possible locations
-            for category, subdir in search_locations:
-                base_path = os.path.join(root, project, "all", "asset", category, subdir, component_name, "hero")
-                test_geo_file = os.path.join(base_path, "{}_geo.abc".format(component_name))
-                test_shader_file = os.path.join(base_path, "{}_rsshade.ma".format(component_name))
+    def _process_sets_locator_with_conflict_check(self, locator, set_namespace, root=None, project=None,
+                                                  existing_ns=None):
+        """Process Sets locator with conflict checking and user choice for existing references.
 
-                if os.path.exists(test_geo_file):
-                    geo_file = test_geo_file
-                    shader_file = test_shader_file
-                    asset_category = category
-                    asset_subdir = subdir
-                    self._log("Found asset in {}/{} directory: {}".format(category, subdir, component_name))
-                    break
-
-            # Check if asset was found
-            if not geo_file:
-                self._log("[ERROR] Asset not found in any directory: {}".format(component_name))
+        existing_ns is an optional set of child namespace names of
+        set_namespace, listed once by callers looping over locators and
+        kept up to date here as components are referenced.
+        """
+        try:
+            resolved = self._resolve_component_asset(locator, set_namespace, root, project,
+                                                     label="Processing locator with conflict check")
+            if resolved is None:
                 return
 
-            self._log("Using {}/{} asset: {}".format(asset_category, asset_subdir, component_name))
-
-            # Create nested namespace for this component
-            component_namespace = "{}_{}".format(component_name, component_id)  # KBDIntCelling_001
-            full_component_ns = "{}:{}".format(set_namespace, component_namespace)  # SETS_KitBedRoomInt_001:KBDIntCelling_001
+            component_name = resolved["component_name"]
+            component_id = resolved["component_id"]
+            full_component_ns = resolved["full_component_ns"]
 
             # Check if this component namespace already exists (conflict check)
-            if cmds.namespace(exists=full_component_ns):
+            if existing_ns is None:
+                existing_ns = _child_namespace_names(set_namespace)
+            if full_component_ns.rpartition(":")[2] in existing_ns:
                 self._log("[CONFLICT] Component namespace already exists: {}".format(full_component_ns))
 
                 # Ask user what to do
@@ -1390,7 +1941,8 @@ class ShotBuildTab(QtWidgets.QWidget):
                     return
                 elif choice == "next":
                     # Find next available identifier
-                    next_id = self._find_next_available_identifier(set_namespace, component_name, component_id)
+                    next_id = self._find_next_available_identifier(set_namespace, component_name, component_id,
+                                                                   existing_ns)
                     if next_id:
                         component_id = next_id
                         component_namespace = "{}_{}".format(component_name, component_id)
@@ -1404,18 +1956,15 @@ class ShotBuildTab(QtWidgets.QWidget):
                     return
 
             # Import geometry and shader (same as original function)
-            self._import_component_geometry_and_shader(locator, full_component_ns, geo_file, shader_file)
+            self._import_component_geometry_and_shader(
+                locator, full_component_ns, resolved["geo_file"], resolved["shader_file"])
+            existing_ns.add(full_component_ns.rpartition(":")[2])
 
         except Exception as e:
             self._log("[ERROR] Failed to process locator with conflict check {}: {}".format(locator, str(e)))
 
     def _ask_reference_conflict_choice(self, component_name, component_id):
         """Ask user what to do when reference already exists."""
-        try:
-            from PySide2 import QtWidgets
-        except ImportError:
-            from PySide6 import QtWidgets
-
         msg = QtWidgets.QMessageBox()
         msg.setWindowTitle("Reference Conflict")
         msg.setText("Reference already exists for component: {}_{}".format(component_name, component_id))
@@ -1435,19 +1984,27 @@ class ShotBuildTab(QtWidgets.QWidget):
         else:
             return "cancel"
 
-    def _find_next_available_identifier(self, set_namespace, component_name, current_id):
-        """Find next available identifier for component."""
+    def _find_next_available_identifier(self, set_namespace, component_name, current_id, existing_ns=None):
+        """Find next available identifier for component.
+
+        existing_ns is an optional set of child namespace names of
+        set_namespace already listed by the caller.
+        """
         try:
             # Convert current ID to integer and start from next
             current_num = int(current_id)
             next_num = current_num + 1
 
+            # One namespaceInfo call instead of a namespace(exists=) per candidate ID
+            if existing_ns is None:
+                existing_ns = _child_namespace_names(set_namespace)
+            prefix = component_name + "_"
+            used = set(leaf[len(prefix):] for leaf in existing_ns if leaf.startswith(prefix))
+
             # Check up to 999 for available identifier
             for i in range(next_num, 1000):
                 test_id = str(i).zfill(3)  # 002, 003, etc.
-                test_namespace = "{}:{}_{}".format(set_namespace, component_name, test_id)
-
-                if not cmds.namespace(exists=test_namespace):
+                if test_id not in used:
                     return test_id
 
             return None  # No available identifier found
@@ -1460,30 +2017,26 @@ class ShotBuildTab(QtWidgets.QWidget):
         """Reference geometry and shader for component (using standard workflow)."""
         try:
             # Reference geometry if exists
-            if os.path.exists(geo_file):
+            if _cached_exists(geo_file):
                 try:
-                    cmds.file(geo_file, reference=True, namespace=full_component_ns)
+                    self._log_verbose("  Referencing geometry file...")
+                    new_nodes = cmds.file(geo_file, reference=True, namespace=full_component_ns,
+                                          returnNewNodes=True) or []
                     self._log("Referenced geometry: {} -> {}".format(geo_file, full_component_ns))
 
                     # Find top-level transform in the referenced geometry
-                    ref_nodes = cmds.ls("{}:*".format(full_component_ns), type="transform") or []
-                    top_level_nodes = []
-
-                    for node in ref_nodes:
-                        # Check if this node has no parent (except world)
-                        parents = cmds.listRelatives(node, parent=True, fullPath=True) or []
-                        if not parents or parents[0] == "|":
-                            top_level_nodes.append(node)
+                    top_level_nodes = _top_level_transforms(full_component_ns, new_nodes)
 
                     # Parent top-level nodes to locator (move object, not preserve position)
                     for top_node in top_level_nodes:
                         try:
-                            cmds.parent(top_node, locator)
+                            self._log_verbose("    Parenting {} to locator {}", top_node, locator)
+                            # parent returns the node's new path under the locator
+                            parented = cmds.parent(top_node, locator)[0]
                             self._log("Parented {} to locator {}".format(top_node, locator))
 
-                            # Reset top-level transform to origin (TR=0, Scale=1)
-                            cmds.xform(top_node, translation=[0, 0, 0], rotation=[0, 0, 0])
-                            cmds.xform(top_node, scale=[1, 1, 1])
+                            # Reset top-level transform to origin (TR=0, Scale=1) in one call
+                            cmds.xform(parented, translation=(0, 0, 0), rotation=(0, 0, 0), scale=(1, 1, 1))
                             self._log("Reset {} transform to origin".format(top_node))
 
                         except Exception as e:
@@ -1495,14 +2048,17 @@ class ShotBuildTab(QtWidgets.QWidget):
                 self._log("[WARNING] Geometry file not found: {}".format(geo_file))
 
             # Reference shader if exists
-            if os.path.exists(shader_file):
+            if _cached_exists(shader_file):
                 try:
                     shader_ns = "{}_shade".format(full_component_ns)  # SETS_KitBedRoomInt_001:KBDIntCelling_001_shade
-                    cmds.file(shader_file, reference=True, namespace=shader_ns)
+                    self._log_verbose("  Referencing shader file...")
+                    self._log_verbose("  Shader namespace: {}", shader_ns)
+                    shader_nodes = cmds.file(shader_file, reference=True, namespace=shader_ns,
+                                             returnNewNodes=True) or []
                     self._log("Referenced shader: {} -> {}".format(shader_file, shader_ns))
 
                     # Assign shaders to geometry
-                    self._assign_component_shaders(full_component_ns, shader_ns)
+                    self._assign_component_shaders(full_component_ns, shader_ns, shader_nodes)
 
                 except Exception as e:
                     self._log("[ERROR] Failed to reference shader {}: {}".format(shader_file, str(e)))
@@ -1512,34 +2068,39 @@ class ShotBuildTab(QtWidgets.QWidget):
         except Exception as e:
             self._log("[ERROR] Failed to reference component geometry and shader: {}".format(str(e)))
 
-    def _assign_component_shaders(self, geo_ns, shader_ns):
-        """Assign shaders to geometry for a Sets component and bind to rsMeshParameters."""
+    def _assign_component_shaders(self, geo_ns, shader_ns, shader_nodes=None):
+        """Assign shaders to geometry for a Sets component and bind to rsMeshParameters.
+
+        shader_nodes, when given, are the nodes returned by the shader
+        reference and are filtered instead of globbing the shader namespace.
+        """
         try:
             self._log("Assigning shaders from {} to geometry in {}".format(shader_ns, geo_ns))
 
             # Find shading groups in shader namespace
-            shader_sgs = cmds.ls("{}:*".format(shader_ns), type="shadingEngine") or []
+            if shader_nodes is None:
+                shader_sgs = cmds.ls("{}:*".format(shader_ns), type="shadingEngine") or []
+            else:
+                shader_sgs = _in_namespace(cmds.ls(shader_nodes, type="shadingEngine") or [], shader_ns)
 
             if not shader_sgs:
                 self._log("[WARNING] No shading groups found in shader namespace: {}".format(shader_ns))
                 return
 
             # Find geometry shapes and transforms in geo namespace
-            geo_shapes = []
-            geo_transforms = cmds.ls("{}:*".format(geo_ns), type="transform") or []
+            # Long names carry the parent path, so no per-node listRelatives is needed
+            geo_transforms = cmds.ls("{}:*".format(geo_ns), type="transform", long=True) or []
             top_level_transforms = []
 
             for xform in geo_transforms:
                 # Check if this is a top-level transform (no parent except world or locator)
-                parents = cmds.listRelatives(xform, parent=True, fullPath=True) or []
-                if not parents or parents[0] == "|" or "Loc" in parents[0]:
+                parent = xform.rpartition("|")[0]
+                if not parent or "Loc" in parent:
                     top_level_transforms.append(xform)
 
-                # Collect mesh shapes
-                shapes = cmds.listRelatives(xform, shapes=True, fullPath=True) or []
-                for shape in shapes:
-                    if cmds.nodeType(shape) == "mesh":
-                        geo_shapes.append(shape)
+            # Collect mesh shapes with one query for all transforms
+            geo_shapes = (cmds.listRelatives(geo_transforms, shapes=True, type="mesh", fullPath=True) or []
+                          if geo_transforms else [])
 
             if not geo_shapes:
                 self._log("[WARNING] No mesh shapes found in geometry namespace: {}".format(geo_ns))
@@ -1600,6 +2161,18 @@ class ShotBuildTab(QtWidgets.QWidget):
 
         self._log("[BUILD ASSETS] Starting other assets build process...")
 
+        # Shader/groom files may have been published since the last build
+        _clear_stat_cache()
+
+        # Start pulling the cache files off the share while Maya references earlier ones
+        if _WARM_POOL is not None:
+            for asset in other_assets:
+                _WARM_POOL.submit(_warm_file, asset['full_path'])
+
+        # Resolve shader/groom locations for all assets up front
+        _prefetch_shader_paths(self.root_path_edit.text().strip(),
+                               self.project_combo.currentText(), other_assets)
+
         # Group assets by category
         categories = {}
         for asset in other_assets:
@@ -1608,76 +2181,68 @@ class ShotBuildTab(QtWidgets.QWidget):
                 categories[cat] = []
             categories[cat].append(asset)
 
-        # Process each category
-        for category, assets in categories.items():
-            self._log("Processing {} {} assets...".format(len(assets), category))
+        # One undo chunk for the whole pass, without viewport redraws per edit
+        cmds.undoInfo(openChunk=True)
+        cmds.refresh(suspend=True)
+        try:
+            # Reference nodes already in the scene; each new reference is the set difference
+            known_refs = set(cmds.ls(type="reference") or [])
 
-            for asset in assets:
-                try:
-                    # Reference alembic cache with namespace
-                    namespace = asset['namespace']
-                    cache_file = asset['full_path']
-                    name = asset['name']
-                    identifier = asset['identifier']
-
-                    self._log("Referencing {} cache: {} with namespace: {}".format(category, asset['filename'], namespace))
-
-                    # Reference the alembic file with namespace
-                    cmds.file(cache_file, reference=True, namespace=namespace)
-
-                    # Move the reference node to appropriate group
-                    group_name = self._get_group_for_category(category)
-                    if cmds.objExists(group_name):
-                        # Find the reference node for this namespace
-                        ref_nodes = cmds.ls(type="reference") or []
-                        target_ref = None
-
-                        for ref_node in ref_nodes:
-                            if ref_node == "sharedReferenceNode":
-                                continue
-                            try:
-                                # Get the namespace of this reference
-                                ref_namespace = cmds.referenceQuery(ref_node, namespace=True)
-                                if ref_namespace == ":{}".format(namespace):
-                                    target_ref = ref_node
-                                    break
-                            except Exception:
-                                continue
-
-                        if target_ref:
-                            # Get the top-level nodes from this reference
-                            try:
-                                ref_nodes_list = cmds.referenceQuery(target_ref, nodes=True, dagPath=True) or []
-                                # Find top-level transforms (no parent outside the reference)
-                                top_level_nodes = []
-                                for node in ref_nodes_list:
-                                    if cmds.nodeType(node) == "transform":
-                                        parent = cmds.listRelatives(node, parent=True, fullPath=True)
-                                        if not parent or not any(p in ref_nodes_list for p in parent):
-                                            top_level_nodes.append(node)
-
-                                # Parent top-level nodes to the group
-                                for top_node in top_level_nodes:
-                                    try:
-                                        cmds.parent(top_node, group_name)
-                                        self._log("Moved {} to {}".format(top_node, group_name))
-                                    except Exception as e:
-                                        self._log("[WARNING] Failed to move {} to {}: {}".format(top_node, group_name, str(e)))
-
-                            except Exception as e:
-                                self._log("[WARNING] Failed to query reference nodes for {}: {}".format(namespace, str(e)))
-                        else:
-                            self._log("[WARNING] Could not find reference node for namespace: {}".format(namespace))
+            # Category groups don't change during the pass: check them all with one ls
+            existing_groups = _existing_nodes(set(self._CATEGORY_GROUPS.values()))
+
+            # Process each category
+            for category, assets in categories.items():
+                self._log("Processing {} {} assets...".format(len(assets), category))
 
-                    # Reference shader and groom files for this asset
-                    self._reference_shader_and_groom(category, name, identifier)
+                for asset in assets:
+                    try:
+                        # Reference alembic cache with namespace
+                        namespace = asset['namespace']
+                        cache_file = asset['full_path']
+                        name = asset['name']
+                        identifier = asset['identifier']
+
+                        self._log("Referencing {} cache: {} with namespace: {}".format(category, asset['filename'], namespace))
+
+                        # Reference the alembic file with namespace
+                        cmds.file(cache_file, reference=True, namespace=namespace)
+                        all_refs = set(cmds.ls(type="reference") or [])
+                        new_refs = all_refs - known_refs
+                        known_refs = all_refs
+
+                        # Move the reference node to appropriate group
+                        group_name = self._get_group_for_category(category)
+                        if group_name in existing_groups:
+                            # The reference node this asset just created
+                            new_refs.discard("sharedReferenceNode")
+                            target_ref = next(iter(new_refs), None)
+
+                            if target_ref:
+                                # Get the top-level nodes from this reference
+                                try:
+                                    ref_nodes_list = cmds.referenceQuery(target_ref, nodes=True, dagPath=True) or []
+                                    # Find top-level transforms (no parent outside the reference)
+                                    top_level_nodes = _reference_top_nodes(ref_nodes_list)
+
+                                    self._parent_to_group(top_level_nodes, group_name)
+                                except Exception as e:
+                                    self._log("[WARNING] Failed to query reference nodes for {}: {}".format(namespace, str(e)))
+                            else:
+                                self._log("[WARNING] Could not find reference node for namespace: {}".format(namespace))
 
-                    # Update status in table
-                    self._update_asset_status(asset['filename'], "Referenced")
+                        # Reference shader and groom files for this asset
+                        self._reference_shader_and_groom(category, name, identifier)
 
-                except Exception as e:
-                    self._log("[ERROR] Failed to build {} asset {}: {}".format(category, asset['filename'], str(e)))
-                    self._update_asset_status(asset['filename'], "Failed")
+                        # Update status in table
+                        self._update_asset_status(asset['filename'], "Referenced")
+
+                    except Exception as e:
+                        self._log("[ERROR] Failed to build {} asset {}: {}".format(category, asset['filename'], str(e)))
+                        self._update_asset_status(asset['filename'], "Failed")
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
 
         self._log("[BUILD ASSETS] Completed other assets build process")
 
@@ -1690,15 +2255,6 @@ class ShotBuildTab(QtWidgets.QWidget):
         """Update assets from new shot version - only update geometry from */publish/{version} paths."""
         self._log("[UPDATE] UPDATE ASSETS button clicked!")
 
-        # Check if Maya is available
-        try:
-            import maya.cmds as cmds
-            self._log("[DEBUG] Maya cmds available for update")
-        except ImportError:
-            self._log("[ERROR] Maya cmds not available - cannot update assets")
-            self._log("[INFO] This function requires Maya to be running")
-            return
-
         if not self.assets_data:
             self._log("[ERROR] No assets loaded. Please load cache list first.")
             return
@@ -1707,55 +2263,77 @@ class ShotBuildTab(QtWidgets.QWidget):
         self._log("[DEBUG] Found {} total assets to process".format(len(self.assets_data)))
 
         # Separate Sets and other assets
-        sets_assets = [asset for asset in self.assets_data if asset['category'] == 'SETS']
+        sets_assets = self._assets_by_category.get('SETS', [])
         other_assets = [asset for asset in self.assets_data if asset['category'] != 'SETS']
 
         self._log("[DEBUG] Sets assets: {}, Other assets: {}".format(len(sets_assets), len(other_assets)))
 
-        # Update Sets assets first (complex merge process)
-        if sets_assets:
-            self._log("[UPDATE SETS] Updating {} Sets assets...".format(len(sets_assets)))
-            for i, asset in enumerate(sets_assets, 1):
-                self._log("[UPDATE SETS] Processing asset {}/{}: {}".format(i, len(sets_assets), asset['filename']))
-                try:
-                    self._update_single_sets_asset(asset)
-                    self._update_asset_status(asset['filename'], "Updated")
-                except Exception as e:
-                    self._log("[ERROR] Failed to update Sets asset {}: {}".format(asset['filename'], str(e)))
-                    self._update_asset_status(asset['filename'], "Update Failed")
-
-        # Update other assets (simple reference replacement)
-        if other_assets:
-            self._log("[UPDATE OTHER] Updating {} other assets...".format(len(other_assets)))
-            for i, asset in enumerate(other_assets, 1):
-                self._log("[UPDATE OTHER] Processing asset {}/{}: {}".format(i, len(other_assets), asset['filename']))
-                try:
-                    self._update_single_other_asset(asset)
-                    self._update_asset_status(asset['filename'], "Updated")
-                except Exception as e:
-                    self._log("[ERROR] Failed to update other asset {}: {}".format(asset['filename'], str(e)))
-                    self._update_asset_status(asset['filename'], "Update Failed")
+        # New components may have been published since the last build
+        _clear_stat_cache()
+        self._asset_lookup_cache.clear()
+
+        # One undo chunk for the whole pass, without viewport redraws per edit
+        cmds.undoInfo(openChunk=True)
+        cmds.refresh(suspend=True)
+        try:
+            # Asset namespaces present before the pass, for the per-asset existence checks
+            existing_ns = _scene_namespaces()
+
+            # Update Sets assets first (complex merge process)
+            if sets_assets:
+                self._log("[UPDATE SETS] Updating {} Sets assets...".format(len(sets_assets)))
+                for i, asset in enumerate(sets_assets, 1):
+                    self._log("[UPDATE SETS] Processing asset {}/{}: {}".format(i, len(sets_assets), asset['filename']))
+                    try:
+                        self._update_single_sets_asset(asset, existing_ns)
+                        self._update_asset_status(asset['filename'], "Updated")
+                    except Exception as e:
+                        self._log("[ERROR] Failed to update Sets asset {}: {}".format(asset['filename'], str(e)))
+                        self._update_asset_status(asset['filename'], "Update Failed")
+
+            # Only shot publish caches are updated; drop the rest before any scene queries
+            update_others = []
+            for asset in other_assets:
+                if _is_shot_publish_cache(asset):
+                    update_others.append(asset)
+                else:
+                    self._log("[SKIP] Not a shot publish cache: {}".format(asset['filename']))
+            other_assets = update_others
+
+            # Update other assets (simple reference replacement)
+            if other_assets:
+                self._log("[UPDATE OTHER] Updating {} other assets...".format(len(other_assets)))
+                # Each asset owns its namespace, so one index serves the whole pass
+                ref_index = _reference_index()
+                for i, asset in enumerate(other_assets, 1):
+                    self._log("[UPDATE OTHER] Processing asset {}/{}: {}".format(i, len(other_assets), asset['filename']))
+                    try:
+                        self._update_single_other_asset(asset, ref_index, existing_ns)
+                        self._update_asset_status(asset['filename'], "Updated")
+                    except Exception as e:
+                        self._log("[ERROR] Failed to update other asset {}: {}".format(asset['filename'], str(e)))
+                        self._update_asset_status(asset['filename'], "Update Failed")
+        finally:
+            cmds.refresh(suspend=False)
+            cmds.undoInfo(closeChunk=True)
 
         self._log("[UPDATE ASSETS] Completed asset update process")
 
-    def _update_single_sets_asset(self, asset):
-        """Update a single Sets asset - UPDATE existing SETS, don't create new ones."""
-        try:
-            # Check if Maya is available
-            try:
-                import maya.cmds as cmds
-                self._log("[DEBUG] Maya cmds imported successfully")
-            except ImportError:
-                self._log("[ERROR] Maya cmds not available - cannot update Sets asset")
-                return
+    def _update_single_sets_asset(self, asset, existing_ns=None):
+        """Update a single Sets asset - UPDATE existing SETS, don't create new ones.
 
+        existing_ns is an optional _scene_namespaces() snapshot shared by a
+        caller updating many assets.
+        """
+        try:
             namespace = asset['namespace']
             cache_file = asset['full_path']
 
             self._log("[UPDATE SETS] Updating individual SETS asset: {}".format(asset['filename']))
 
             # Step 1: Check if SETS namespace exists in scene
-            if not cmds.namespace(exists=namespace):
+            if not (namespace in existing_ns if existing_ns is not None
+                    else cmds.namespace(exists=namespace)):
                 self._log("[ERROR] SETS namespace {} not found in scene - cannot update non-existing asset".format(namespace))
                 self._log("[INFO] Use BUILD button to create new SETS asset")
                 return
@@ -1766,10 +2344,9 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             if cmds.objExists(sets_grp):
                 children = cmds.listRelatives(sets_grp, children=True, fullPath=True) or []
-                for child in children:
-                    if child.endswith(":Main_Grp") and namespace in child:
-                        sets_main_grp = child
-                        break
+                # Direct child whose leaf is exactly <namespace>:Main_Grp: one tail check each
+                needle = "|{}:Main_Grp".format(namespace)
+                sets_main_grp = next((child for child in children if child.endswith(needle)), None)
 
             if not sets_main_grp:
                 self._log("[ERROR] SETS Main_Grp not found under Sets_Grp - cannot update non-existing asset")
@@ -1819,35 +2396,37 @@ class ShotBuildTab(QtWidgets.QWidget):
                 cmds.namespace(setNamespace=current_ns)
 
             # Step 6: Check for NEW locators that need component references
-            all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform") or []
+            # Long names so the batched children lookup can key on the parent path
+            all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform", long=True) or []
             new_locators = []
             existing_locators = []
 
             self._log("Checking {} locators after SETS update...".format(len(all_locators)))
 
+            # Transform children of every locator (constraints etc. filtered out) in one pass
+            children_by_loc = _transform_children(all_locators)
             for loc in all_locators:
-                children = cmds.listRelatives(loc, children=True, fullPath=True) or []
-                # Filter out non-geometry children (like constraints, etc.)
-                geometry_children = []
-                for child in children:
-                    if cmds.nodeType(child) == "transform":
-                        geometry_children.append(child)
+                geometry_children = children_by_loc[loc]
 
                 if not geometry_children:
                     new_locators.append(loc)
-                    self._log("Found NEW locator (no component references): {}".format(loc.split(":")[-1]))
+                    self._log_verbose("Found NEW locator (no component references): {}", _short(loc))
                 else:
                     existing_locators.append(loc)
-                    self._log("Existing locator {} has {} component references - keeping".format(loc.split(":")[-1], len(geometry_children)))
+                    self._log_verbose("Existing locator {} has {} component references - keeping",
+                                      _short(loc), len(geometry_children))
 
             self._log("Found {} NEW locators and {} existing locators with references".format(len(new_locators), len(existing_locators)))
 
             # Step 7: Only create references for NEW locators
             if new_locators:
                 self._log("Creating component references for {} new locators...".format(len(new_locators)))
+                root = self.root_path_edit.text().strip()
+                project = self.project_combo.currentText()
+                child_ns = _child_namespace_names(namespace)
                 for loc in new_locators:
-                    self._log("Processing new locator: {}".format(loc.split(":")[-1]))
-                    self._process_sets_locator_with_conflict_check(loc, namespace)
+                    self._log("Processing new locator: {}".format(_short(loc)))
+                    self._process_sets_locator_with_conflict_check(loc, namespace, root, project, child_ns)
             else:
                 self._log("No new locators found - all locators already have component references")
 
@@ -1860,24 +2439,20 @@ class ShotBuildTab(QtWidgets.QWidget):
         except Exception as e:
             self._log("[ERROR] ERROR updating Sets asset {}: {}".format(asset['filename'], str(e)))
 
-    def _update_single_drsg_asset(self, asset):
-        """Update a single Dressing asset - SAME PROCESS as SETS UPDATE."""
-        try:
-            # Check if Maya is available
-            try:
-                import maya.cmds as cmds
-                self._log("[DEBUG] Maya cmds imported successfully")
-            except ImportError:
-                self._log("[ERROR] Maya cmds not available - cannot update Dressing asset")
-                return
+    def _update_single_drsg_asset(self, asset, existing_ns=None):
+        """Update a single Dressing asset - SAME PROCESS as SETS UPDATE.
 
+        existing_ns is an optional _scene_namespaces() snapshot.
+        """
+        try:
             namespace = asset['namespace']
             cache_file = asset['full_path']
 
             self._log("[UPDATE DRSG] Updating individual DRSG asset: {}".format(asset['filename']))
 
             # Step 1: Check if DRSG namespace exists in scene
-            if not cmds.namespace(exists=namespace):
+            if not (namespace in existing_ns if existing_ns is not None
+                    else cmds.namespace(exists=namespace)):
                 self._log("[ERROR] DRSG namespace {} not found in scene - cannot update non-existing asset".format(namespace))
                 self._log("[INFO] Use BUILD button to create new DRSG asset")
                 return
@@ -1888,10 +2463,9 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             if cmds.objExists(drsg_grp):
                 children = cmds.listRelatives(drsg_grp, children=True, fullPath=True) or []
-                for child in children:
-                    if child.endswith(":Main_Grp") and namespace in child:
-                        drsg_main_grp = child
-                        break
+                # Direct child whose leaf is exactly <namespace>:Main_Grp: one tail check each
+                needle = "|{}:Main_Grp".format(namespace)
+                drsg_main_grp = next((child for child in children if child.endswith(needle)), None)
 
             if not drsg_main_grp:
                 self._log("[ERROR] DRSG Main_Grp not found under Dressing_Grp - cannot update non-existing asset")
@@ -1940,35 +2514,37 @@ class ShotBuildTab(QtWidgets.QWidget):
                 cmds.namespace(setNamespace=current_ns)
 
             # Step 5: Check for NEW locators that need component references (same as SETS)
-            all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform") or []
+            # Long names so the batched children lookup can key on the parent path
+            all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform", long=True) or []
             new_locators = []
             existing_locators = []
 
             self._log("Checking {} locators after DRSG update...".format(len(all_locators)))
 
+            # Transform children of every locator (constraints etc. filtered out) in one pass
+            children_by_loc = _transform_children(all_locators)
             for loc in all_locators:
-                children = cmds.listRelatives(loc, children=True, fullPath=True) or []
-                # Filter out non-geometry children (like constraints, etc.)
-                geometry_children = []
-                for child in children:
-                    if cmds.nodeType(child) == "transform":
-                        geometry_children.append(child)
+                geometry_children = children_by_loc[loc]
 
                 if not geometry_children:
                     new_locators.append(loc)
-                    self._log("Found NEW locator (no component references): {}".format(loc.split(":")[-1]))
+                    self._log_verbose("Found NEW locator (no component references): {}", _short(loc))
                 else:
                     existing_locators.append(loc)
-                    self._log("Existing locator {} has {} component references - keeping".format(loc.split(":")[-1], len(geometry_children)))
+                    self._log_verbose("Existing locator {} has {} component references - keeping",
+                                      _short(loc), len(geometry_children))
 
             self._log("Found {} NEW locators and {} existing locators with references".format(len(new_locators), len(existing_locators)))
 
             # Step 6: Only create references for NEW locators (reuse SETS method)
             if new_locators:
                 self._log("Creating component references for {} new locators...".format(len(new_locators)))
+                root = self.root_path_edit.text().strip()
+                project = self.project_combo.currentText()
+                child_ns = _child_namespace_names(namespace)
                 for loc in new_locators:
-                    self._log("Processing new locator: {}".format(loc.split(":")[-1]))
-                    self._process_sets_locator_with_conflict_check(loc, namespace)
+                    self._log("Processing new locator: {}".format(_short(loc)))
+                    self._process_sets_locator_with_conflict_check(loc, namespace, root, project, child_ns)
             else:
                 self._log("No new locators found - all locators already have component references")
 
@@ -1986,16 +2562,13 @@ class ShotBuildTab(QtWidgets.QWidget):
         try:
             # Extract component info from locator
             loc_short = locator.split(":")[-1]  # Get short name
-            if not loc_short.endswith("_Loc"):
+            if loc_short[-4:] != "_Loc":
                 return
 
-            component_parts = loc_short.replace("_Loc", "").split("_")
-            if len(component_parts) < 2:
+            component_name, sep, component_id = loc_short[:-4].rpartition("_")  # suffix checked above
+            if not sep or not component_name:
                 return
 
-            component_name = "_".join(component_parts[:-1])
-            component_id = component_parts[-1]
-
             # Check if locator has children (referenced geometry)
             children = cmds.listRelatives(locator, children=True, fullPath=True) or []
             if not children:
@@ -2008,49 +2581,38 @@ class ShotBuildTab(QtWidgets.QWidget):
         except Exception as e:
             self._log("[ERROR] Failed to check locator references for {}: {}".format(locator, str(e)))
 
-    def _remove_locator_references(self, removed_locator_name, set_namespace):
-        """Remove references associated with a deleted locator."""
+    def _remove_locator_references(self, removed_locator_name, set_namespace, ref_index=None):
+        """Remove references associated with a deleted locator.
+
+        ref_index is an optional _reference_index() snapshot; removed
+        entries are popped so it stays valid for the caller.
+        """
         try:
             # Extract component info from removed locator name
             loc_short = removed_locator_name.split(":")[-1]
-            if not loc_short.endswith("_Loc"):
+            if loc_short[-4:] != "_Loc":
                 return
 
-            component_parts = loc_short.replace("_Loc", "").split("_")
-            if len(component_parts) < 2:
+            component_name, sep, component_id = loc_short[:-4].rpartition("_")  # suffix checked above
+            if not sep or not component_name:
                 return
 
-            component_name = "_".join(component_parts[:-1])
-            component_id = component_parts[-1]
-
             # Build expected component namespace
             full_component_ns = "{}:{}_{:03d}".format(set_namespace, component_name, int(component_id))
 
-            # Find and remove geometry reference
-            geo_refs = cmds.ls(type="reference") or []
-            for ref in geo_refs:
-                if ref == "sharedReferenceNode":
-                    continue
-                try:
-                    ref_namespace = cmds.referenceQuery(ref, namespace=True)
-                    if ref_namespace == ":{}".format(full_component_ns):
-                        cmds.file(removeReference=True, referenceNode=ref)
-                        self._log("Removed geometry reference: {}".format(ref))
-                        break
-                except Exception:
-                    continue
+            if ref_index is None:
+                ref_index = _reference_index()
 
-            # Find and remove shader reference
+            # Find and remove geometry and shader references
             shader_ns = "{}_shade".format(full_component_ns)
-            for ref in geo_refs:
-                if ref == "sharedReferenceNode":
+            for kind, ns in (("geometry", full_component_ns), ("shader", shader_ns)):
+                entry = ref_index.get(ns)
+                if not entry:
                     continue
                 try:
-                    ref_namespace = cmds.referenceQuery(ref, namespace=True)
-                    if ref_namespace == ":{}".format(shader_ns):
-                        cmds.file(removeReference=True, referenceNode=ref)
-                        self._log("Removed shader reference: {}".format(ref))
-                        break
+                    cmds.file(removeReference=True, referenceNode=entry[0])
+                    del ref_index[ns]
+                    self._log("Removed {} reference: {}".format(kind, entry[0]))
                 except Exception:
                     continue
 
@@ -2079,17 +2641,13 @@ class ShotBuildTab(QtWidgets.QWidget):
         except Exception as e:
             self._log("[ERROR] Failed to check/reference locator {}: {}".format(locator, str(e)))
 
-    def _update_single_other_asset(self, asset):
-        """Update a single non-Sets asset by replacing geometry reference."""
-        try:
-            # Check if Maya is available
-            try:
-                import maya.cmds as cmds
-                self._log("[DEBUG] Maya cmds imported successfully for other asset")
-            except ImportError:
-                self._log("[ERROR] Maya cmds not available - cannot update other asset")
-                return
+    def _update_single_other_asset(self, asset, ref_index=None, existing_ns=None):
+        """Update a single non-Sets asset by replacing geometry reference.
 
+        ref_index and existing_ns are optional _reference_index() and
+        _scene_namespaces() snapshots shared by a caller updating many assets.
+        """
+        try:
             category = asset['category']
             namespace = asset['namespace']
             cache_file = asset['full_path']
@@ -2118,7 +2676,8 @@ class ShotBuildTab(QtWidgets.QWidget):
             self._log("[UPDATE OTHER] Updating {} reference...".format(asset['filename']))
 
             # Check if namespace exists in scene
-            if not cmds.namespace(exists=namespace):
+            if not (namespace.lstrip(":") in existing_ns if existing_ns is not None
+                    else cmds.namespace(exists=namespace)):
                 self._log("[INFO] Namespace {} not found in scene - creating new {} asset".format(namespace, category))
                 # Create new asset using existing build function
                 self._build_single_other_asset(asset)
@@ -2126,33 +2685,18 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             # Find existing reference for this namespace
             existing_ref = None
-            refs = cmds.ls(type="reference") or []
+            if ref_index is None:
+                ref_index = _reference_index()
 
             self._log("[DEBUG] Searching for references in namespace: {}".format(namespace))
-            self._log("[DEBUG] Found {} total references in scene".format(len(refs)))
+            self._log("[DEBUG] Found {} total references in scene".format(len(ref_index)))
 
-            for ref in refs:
-                if ref == "sharedReferenceNode":
-                    continue
-                try:
-                    ref_namespace = cmds.referenceQuery(ref, namespace=True)
-                    ref_filename = cmds.referenceQuery(ref, filename=True)
-
-                    self._log("[DEBUG] Checking ref: {} | namespace: {} | file: {}".format(
-                        ref, ref_namespace, os.path.basename(ref_filename)))
-
-                    # Check if namespace matches (handle both :namespace and namespace formats)
-                    namespace_match = (ref_namespace == ":{}".format(namespace) or
-                                     ref_namespace == namespace)
-
-                    if namespace_match and ref_filename.endswith(".abc"):
-                        existing_ref = ref
-                        self._log("[DEBUG] Found matching geometry reference: {}".format(ref))
-                        break
-
-                except Exception as e:
-                    self._log("[DEBUG] Error checking reference {}: {}".format(ref, str(e)))
-                    continue
+            # Index keys drop the leading ':' so both namespace formats match
+            ref_key = namespace.lstrip(":")
+            entry = ref_index.get(ref_key)
+            if entry and entry[1].endswith(".abc"):
+                existing_ref = entry[0]
+                self._log("[DEBUG] Found matching geometry reference: {}".format(existing_ref))
 
             if not existing_ref:
                 self._log("[WARNING] No existing geometry reference found for namespace: {}".format(namespace))
@@ -2163,8 +2707,8 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             # Replace the reference file path
             try:
-                # Get current reference file
-                old_file = cmds.referenceQuery(existing_ref, filename=True)
+                # Current reference file, already read when the index was built
+                old_file = entry[1]
                 self._log("Replacing reference: {} -> {}".format(os.path.basename(old_file), os.path.basename(cache_file)))
 
                 # Check if files are the same (avoid unnecessary updates)
@@ -2174,6 +2718,7 @@ class ShotBuildTab(QtWidgets.QWidget):
 
                 # Replace reference with new file using loadReference
                 cmds.file(cache_file, loadReference=existing_ref)
+                ref_index[ref_key] = (existing_ref, cache_file)
                 self._log("[OK] Updated reference for {} from {} to {}".format(
                     namespace, os.path.basename(old_file), os.path.basename(cache_file)))
 
@@ -2200,27 +2745,12 @@ class ShotBuildTab(QtWidgets.QWidget):
 
     def _get_group_for_category(self, category):
         """Get the appropriate group name for asset category."""
-        group_map = {
-            "CHAR": "Character_Grp",
-            "PROP": "Props_Grp",
-            "SDRS": "Setdress_Grp",
-            "SETS": "Sets_Grp",
-            "DRSG": "Dressing_Grp",  # New dressing group for shot-based dressing
-            "CAM": "Camera_Grp",
-            "CAMERA": "Camera_Grp"
-        }
-        return group_map.get(category, "Props_Grp")  # Default to Props_Grp
+        return self._CATEGORY_GROUPS.get(category, "Props_Grp")  # Default to Props_Grp
 
     def _update_asset_status(self, filename, status):
         """Update asset status in the table."""
         try:
-            for row in range(self.assets_table.rowCount()):
-                item = self.assets_table.item(row, 0)  # Cache File column
-                if item and item.text() == filename:
-                    status_item = self.assets_table.item(row, 5)  # Status column
-                    if status_item:
-                        status_item.setText(status)
-                    break
+            self.assets_model.set_status(filename, status)
         except Exception as e:
             self._log("[WARNING] Could not update status for {}: {}".format(filename, str(e)))
 
@@ -2236,69 +2766,23 @@ class ShotBuildTab(QtWidgets.QWidget):
             root = self.root_path_edit.text().strip()
             project = self.project_combo.currentText()
 
-            # Build category directory name
-            category_dirs = {
-                "CHAR": "Character",
-                "PROP": "Props",
-                "SDRS": "Setdress",
-                "SETS": "Sets"
-            }
-
-            category_dir = category_dirs.get(category)
-            if not category_dir:
+            search_paths = _shader_search_paths(root, project, category, name)
+            if not search_paths:
                 self._log("[WARNING] Unknown category: {}".format(category))
                 return
 
-            # Build search paths based on category
-            search_paths = []
-
-            if category == "SETS":
-                # Sets: Exterior and Interior
-                search_paths = [
-                    os.path.join(root, project, "all", "asset", category_dir, "Exterior", name, "hero"),
-                    os.path.join(root, project, "all", "asset", category_dir, "Interior", name, "hero")
-                ]
-            elif category == "SDRS":
-                # Setdress: Check name for Int/Ext, then try all paths
-                if "Int" in name:
-                    search_paths = [
-                        os.path.join(root, project, "all", "asset", category_dir, "interior", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "Interior", name, "hero")
-                    ]
-                elif "Ext" in name:
-                    search_paths = [
-                        os.path.join(root, project, "all", "asset", category_dir, "exterior", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "Exterior", name, "hero")
-                    ]
-                else:
-                    # Try all possible paths for setdress
-                    search_paths = [
-                        os.path.join(root, project, "all", "asset", category_dir, "interior", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "Interior", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "exterior", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "Exterior", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "Main", name, "hero"),
-                        os.path.join(root, project, "all", "asset", category_dir, "object", name, "hero")
-                    ]
-            else:
-                # Character, Props: Main and object
-                search_paths = [
-                    os.path.join(root, project, "all", "asset", category_dir, "Main", name, "hero"),
-                    os.path.join(root, project, "all", "asset", category_dir, "object", name, "hero")
-                ]
-
             # Look for shader and groom files
             shader_found = False
             groom_found = False
 
             for search_path in search_paths:
-                if not _validate_directory(search_path):
+                if not _has_hero_dir(search_path):
                     continue
 
                 # Look for shader file: {name}_rsshade.ma (only if not already found)
                 if not shader_found:
                     shader_file = os.path.join(search_path, "{}_rsshade.ma".format(name))
-                    if os.path.exists(shader_file):
+                    if _cached_exists(shader_file):
                         shader_ns = "{}_{}_{}_shade".format(category, name, identifier)
                         try:
                             cmds.file(shader_file, reference=True, namespace=shader_ns)
@@ -2310,7 +2794,7 @@ class ShotBuildTab(QtWidgets.QWidget):
                 # Look for groom file: {name}_groom.ma (only if not already found)
                 if not groom_found:
                     groom_file = os.path.join(search_path, "{}_groom.ma".format(name))
-                    if os.path.exists(groom_file):
+                    if _cached_exists(groom_file):
                         groom_ns = "{}_{}_{}_groom".format(category, name, identifier)
                         try:
                             cmds.file(groom_file, reference=True, namespace=groom_ns)
@@ -2571,7 +3055,7 @@ class ShotBuildTab(QtWidgets.QWidget):
         """Automatically create blendshapes for character assets."""
         self._log("[BLENDSHAPE] Starting automatic BlendShape creation...")
 
-        char_assets = [asset for asset in self.assets_data if asset['category'] == 'CHAR']
+        char_assets = self._assets_by_category.get('CHAR', [])
         if not char_assets:
             self._log("[INFO] No character assets found for blendshape creation.")
             return
@@ -2639,7 +3123,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             self._log("[ERROR] No assets loaded. Please load cache list first.")
             return
 
-        char_assets = [asset for asset in self.assets_data if asset['category'] == 'CHAR']
+        char_assets = self._assets_by_category.get('CHAR', [])
         if not char_assets:
             self._log("[INFO] No character assets found for blendshape creation.")
             return
@@ -2803,6 +3287,13 @@ class ShotBuildTab(QtWidgets.QWidget):
             self._log("=" * 80)
             raise
 
+    def _on_asset_action(self, row, col):
+        """Dispatch a Build/Update button click in the assets table."""
+        if col == AssetsModel.BUILD_COL:
+            self._build_single_asset(row)
+        elif col == AssetsModel.UPDATE_COL:
+            self._update_single_asset(row)
+
     def _build_single_asset(self, asset_index):
         """Build a single asset by index."""
         try:
@@ -2881,7 +3372,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             cache_file = asset['full_path']
 
             self._log("[BUILD] Building individual SETS asset: {}".format(asset['filename']))
-            self._log_verbose("Importing SETS cache: {}".format(asset['filename']))
+            self._log_verbose("Importing SETS cache: {}", asset['filename'])
 
             # Check current scene state and ask user for scene choice (same as Build Sets Step 1)
             scene_state = self._check_scene_state()
@@ -2931,7 +3422,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             try:
                 # Set current namespace so import goes into it automatically
                 cmds.namespace(setNamespace=namespace)
-                self._log("Set current namespace to: {}".format(namespace))
+                self._log_verbose("Set current namespace to: {}", namespace)
 
                 # Import the alembic file (will go into current namespace)
                 cmds.AbcImport(cache_file, mode="import", fitTimeRange=False)
@@ -2940,7 +3431,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             finally:
                 # Always restore original namespace
                 cmds.namespace(setNamespace=current_ns)
-                self._log("Restored namespace to: {}".format(current_ns))
+                self._log_verbose("Restored namespace to: {}", current_ns)
 
             # Find locators in the namespace (should all be there now)
             all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform") or []
@@ -2949,21 +3440,14 @@ class ShotBuildTab(QtWidgets.QWidget):
             # If no locators found in namespace, try fallback search
             if not all_locators:
                 self._log("[WARNING] No locators found in namespace, trying fallback search...")
-                all_locator_shapes = cmds.ls(type="locator") or []
-                fallback_locators = []
-
-                for loc_shape in all_locator_shapes:
-                    loc_transforms = cmds.listRelatives(loc_shape, parent=True, fullPath=True) or []
-                    for loc_transform in loc_transforms:
-                        if loc_transform.endswith("_Loc"):
-                            fallback_locators.append(loc_transform)
-
-                all_locators = fallback_locators
+                all_locators = _scene_loc_transforms()
                 self._log("Found {} locators in fallback search: {}".format(len(all_locators), all_locators))
 
             # Process each locator - SAME AS Build Sets (Step 1)
+            root = self.root_path_edit.text().strip()
+            project = self.project_combo.currentText()
             for loc in all_locators:
-                self._process_sets_locator(loc, namespace)
+                self._process_sets_locator(loc, namespace, root, project)
 
             # Move to Sets group
             sets_group = self._get_group_for_category("SETS")
@@ -2991,7 +3475,7 @@ class ShotBuildTab(QtWidgets.QWidget):
             cache_file = asset['full_path']
 
             self._log("[BUILD] Building individual DRSG asset: {}".format(asset['filename']))
-            self._log_verbose("Importing DRSG cache: {}".format(asset['filename']))
+            self._log_verbose("Importing DRSG cache: {}", asset['filename'])
 
             # Check current scene state and ask user for scene choice (same as SETS)
             scene_state = self._check_scene_state()
@@ -3040,60 +3524,54 @@ class ShotBuildTab(QtWidgets.QWidget):
 
             try:
                 # Set current namespace so import goes into it automatically
-                self._log_verbose("Created namespace: {}".format(namespace))
+                self._log_verbose("Created namespace: {}", namespace)
                 cmds.namespace(setNamespace=namespace)
-                self._log("Set current namespace to: {}".format(namespace))
+                self._log_verbose("Set current namespace to: {}", namespace)
 
                 # Import the alembic file (will go into current namespace)
-                self._log_verbose("Importing alembic cache: {}".format(cache_file))
+                self._log_verbose("Importing alembic cache: {}", cache_file)
                 cmds.AbcImport(cache_file, mode="import", fitTimeRange=False)
                 self._log("Imported alembic into namespace: {}".format(namespace))
 
             finally:
                 # Always restore original namespace
                 cmds.namespace(setNamespace=current_ns)
-                self._log("Restored namespace to: {}".format(current_ns))
+                self._log_verbose("Restored namespace to: {}", current_ns)
 
             # Find locators in the namespace (should all be there now)
             all_locators = cmds.ls("{}:*_Loc".format(namespace), type="transform") or []
             self._log("Found {} locators in namespace: {}".format(len(all_locators), all_locators))
 
-            if all_locators:
-                self._log_verbose("Locator list:")
+            if all_locators and self._verbose:
+                self._log("Locator list:")
                 for i, loc in enumerate(all_locators, 1):
-                    self._log_verbose("  {}: {}".format(i, loc))
+                    self._log("  {}: {}".format(i, loc))
 
             # If no locators found in namespace, try fallback search
             if not all_locators:
                 self._log("[WARNING] No locators found in namespace, trying fallback search...")
-                all_locator_shapes = cmds.ls(type="locator") or []
-                fallback_locators = []
-
-                for loc_shape in all_locator_shapes:
-                    loc_transforms = cmds.listRelatives(loc_shape, parent=True, fullPath=True) or []
-                    for loc_transform in loc_transforms:
-                        if loc_transform.endswith("_Loc"):
-                            fallback_locators.append(loc_transform)
-
-                all_locators = fallback_locators
+                all_locators = _scene_loc_transforms()
                 self._log("Found {} locators in fallback search: {}".format(len(all_locators), all_locators))
 
             # Process each locator - SAME AS SETS (reuse existing method)
-            self._log_verbose("Processing {} locators for component referencing...".format(len(all_locators)))
+            self._log_verbose("Processing {} locators for component referencing...", len(all_locators))
+            root = self.root_path_edit.text().strip()
+            project = self.project_combo.currentText()
             for i, loc in enumerate(all_locators, 1):
-                self._log_verbose("Processing locator {}/{}: {}".format(i, len(all_locators), loc.split(":")[-1]))
-                self._process_sets_locator(loc, namespace)
+                if self._verbose:
+                    self._log("Processing locator {}/{}: {}".format(i, len(all_locators), loc.split(":")[-1]))
+                self._process_sets_locator(loc, namespace, root, project)
 
             # Move to Dressing group
             drsg_group = self._get_group_for_category("DRSG")
-            self._log_verbose("Target group for DRSG: {}".format(drsg_group))
+            self._log_verbose("Target group for DRSG: {}", drsg_group)
             if drsg_group and cmds.objExists(drsg_group):
                 # Find main group in namespace
                 main_grps = cmds.ls("{}:*Main_Grp".format(namespace), type="transform") or []
-                self._log_verbose("Found main groups: {}".format(main_grps))
+                self._log_verbose("Found main groups: {}", main_grps)
                 if main_grps:
                     try:
-                        self._log_verbose("Moving {} to {}".format(main_grps[0], drsg_group))
+                        self._log_verbose("Moving {} to {}", main_grps[0], drsg_group)
                         cmds.parent(main_grps[0], drsg_group)
                         self._log("Moved {} to {}".format(main_grps[0], drsg_group))
                     except Exception as e:
@@ -3156,8 +3634,9 @@ class ShotBuildTab(QtWidgets.QWidget):
                 self._log("[ATTR] Connecting shading attributes...")
                 attr_results = _connect_shading_attributes(namespace, shader_ns.split(':')[-1])  # Remove any namespace prefix
                 if attr_results:
-                    for result in attr_results:
-                        self._log_verbose("  {}".format(result))
+                    if self._verbose:
+                        for result in attr_results:
+                            self._log("  {}".format(result))
                     connected_count = sum(1 for r in attr_results if r.startswith("// Result: Connected"))
                     if connected_count > 0:
                         self._log("[OK] Connected {} shading attributes".format(connected_count))
@@ -3220,46 +3699,51 @@ class ShotBuildTab(QtWidgets.QWidget):
             anim_ns = asset['namespace']
             groom_ns = "{}_groom".format(anim_ns)
 
-            self._log_verbose("=== BLENDSHAPE AUTO DIAGNOSTICS ===")
-            self._log_verbose("Anim NS: '{}', Groom NS: '{}'".format(anim_ns, groom_ns))
-
-            # Check if namespaces exist
-            all_ns = cmds.namespaceInfo(listOnlyNamespaces=True) or []
-            self._log_verbose("Namespace exists - Anim: {}, Groom: {}".format(anim_ns in all_ns, groom_ns in all_ns))
+            verbose = self._verbose
+            if verbose:
+                self._log("=== BLENDSHAPE AUTO DIAGNOSTICS ===")
+                self._log("Anim NS: '{}', Groom NS: '{}'".format(anim_ns, groom_ns))
+                # Namespace listing is only needed for the diagnostic line
+                self._log("Namespace exists - Anim: {}, Groom: {}".format(
+                    cmds.namespace(exists=anim_ns), cmds.namespace(exists=groom_ns)))
 
             if cmds.namespace(exists=groom_ns):
                 # Auto-detect correct suffixes by checking what exists in scene
                 anim_suffix, groom_suffix = _detect_blendshape_suffixes(anim_ns, groom_ns)
 
-                self._log_verbose("Auto-detected suffixes - Anim: '{}', Groom: '{}'".format(anim_suffix, groom_suffix))
+                if verbose:
+                    self._log("Auto-detected suffixes - Anim: '{}', Groom: '{}'".format(anim_suffix, groom_suffix))
 
-                # Check objects in groom namespace
-                groom_all = cmds.ls(groom_ns + ":*", type="transform") or []
-                groom_with_suffix = cmds.ls(groom_ns + ":*" + groom_suffix, type="transform") or []
-                anim_all = cmds.ls(anim_ns + ":*", type="transform") or []
-                anim_with_suffix = cmds.ls(anim_ns + ":*" + anim_suffix, type="transform") or []
+                    # Object counts are diagnostics only; skip the four scene globs otherwise
+                    groom_all = cmds.ls(groom_ns + ":*", type="transform") or []
+                    groom_with_suffix = cmds.ls(groom_ns + ":*" + groom_suffix, type="transform") or []
+                    anim_all = cmds.ls(anim_ns + ":*", type="transform") or []
+                    anim_with_suffix = cmds.ls(anim_ns + ":*" + anim_suffix, type="transform") or []
 
-                self._log_verbose("Objects found - Groom all: {}, with suffix: {}".format(len(groom_all), len(groom_with_suffix)))
-                self._log_verbose("Objects found - Anim all: {}, with suffix: {}".format(len(anim_all), len(anim_with_suffix)))
+                    self._log("Objects found - Groom all: {}, with suffix: {}".format(len(groom_all), len(groom_with_suffix)))
+                    self._log("Objects found - Anim all: {}, with suffix: {}".format(len(anim_all), len(anim_with_suffix)))
 
-                if groom_with_suffix:
-                    self._log_verbose("Groom objects: {}".format([_short(x) for x in groom_with_suffix[:3]]))
-                if anim_with_suffix:
-                    self._log_verbose("Anim objects: {}".format([_short(x) for x in anim_with_suffix[:3]]))
+                    if groom_with_suffix:
+                        self._log("Groom objects: {}".format([_short(x) for x in groom_with_suffix[:3]]))
+                    if anim_with_suffix:
+                        self._log("Anim objects: {}".format([_short(x) for x in anim_with_suffix[:3]]))
 
                 # Use enhanced function with auto-detection disabled (already detected above)
                 pairs = _pairs_groom_first(anim_ns, groom_ns, anim_suffix, groom_suffix, allow_fuzzy=True, auto_detect_suffixes=False)
-                self._log_verbose("Found {} pairs for BlendShape processing".format(len(pairs)))
+                if verbose:
+                    self._log("Found {} pairs for BlendShape processing".format(len(pairs)))
 
                 if pairs:
                     success_count = 0
                     for i, pair in enumerate(pairs):
-                        self._log_verbose("Pair {}: Groom='{}', Anim='{}', Status='{}'".format(
-                            i+1, pair.get("groomXform", "None"), pair.get("animXform", "None"), pair.get("status", "unknown")))
+                        if verbose:
+                            self._log("Pair {}: Groom='{}', Anim='{}', Status='{}'".format(
+                                i+1, pair.get("groomXform", "None"), pair.get("animXform", "None"), pair.get("status", "unknown")))
 
                         if pair["status"] == "ok" and pair["animXform"] and pair["groomXform"]:
                             result = _blendshape_anim_to_groom(pair["animXform"], pair["groomXform"])
-                            self._log_verbose("  BlendShape result: {}".format(result))
+                            if verbose:
+                                self._log("  BlendShape result: {}".format(result))
                             if "error" not in result.lower():
                                 success_count += 1
                         else:
@@ -3396,6 +3880,36 @@ class ShotBuildTab(QtWidgets.QWidget):
         except Exception as e:
             self._log("[ERROR] Single asset shader assignment failed: {}".format(str(e)))
 
+    def _parent_to_group(self, nodes, group_name):
+        """Parent top-level reference nodes under group_name in one DAG edit.
+
+        If the batched parent fails (e.g. a locked node), the nodes are retried
+        one by one so the failing node is reported; nodes the batch already
+        moved under the group are skipped instead of being reported as failures.
+        """
+        if not nodes:
+            return
+        try:
+            cmds.parent(*(list(nodes) + [group_name]))
+            self._log("Moved {} to {}".format(", ".join(nodes), group_name))
+            return
+        except Exception:
+            pass
+
+        for top_node in nodes:
+            # The batch may have moved this node already, invalidating its old path
+            moved_path = "{}|{}".format(group_name, top_node.rpartition("|")[2])
+            if cmds.objExists(moved_path) and (
+                    not cmds.objExists(top_node)
+                    or cmds.ls(top_node, long=True) == cmds.ls(moved_path, long=True)):
+                self._log("Moved {} to {}".format(top_node, group_name))
+                continue
+            try:
+                cmds.parent(top_node, group_name)
+                self._log("Moved {} to {}".format(top_node, group_name))
+            except Exception as e:
+                self._log("[WARNING] Failed to move {} to {}: {}".format(top_node, group_name, str(e)))
+
     def _move_to_group(self, namespace, group_name):
         """Move referenced asset to appropriate group."""
         try:
@@ -3424,21 +3938,9 @@ class ShotBuildTab(QtWidgets.QWidget):
                 try:
                     ref_nodes_list = cmds.referenceQuery(target_ref, nodes=True, dagPath=True) or []
                     # Find top-level transforms (no parent outside the reference)
-                    top_level_nodes = []
-                    for node in ref_nodes_list:
-                        if cmds.nodeType(node) == "transform":
-                            parent = cmds.listRelatives(node, parent=True, fullPath=True)
-                            if not parent or not any(p in ref_nodes_list for p in parent):
-                                top_level_nodes.append(node)
-
-                    # Parent top-level nodes to the group
-                    for top_node in top_level_nodes:
-                        try:
-                            cmds.parent(top_node, group_name)
-                            self._log("Moved {} to {}".format(top_node, group_name))
-                        except Exception as e:
-                            self._log("[WARNING] Failed to move {} to {}: {}".format(top_node, group_name, str(e)))
+                    top_level_nodes = _reference_top_nodes(ref_nodes_list)
 
+                    self._parent_to_group(top_level_nodes, group_name)
                 except Exception as e:
                     self._log("[WARNING] Failed to query reference nodes for {}: {}".format(namespace, str(e)))
             else:
@@ -4045,23 +4547,17 @@ if __name__ == "__main__":
                 self._log("[WARNING] Scene path does not exist: {}".format(scene_path))
                 return []
 
-            # Scan episodes
-            for episode in os.listdir(scene_path):
+            # Scan episodes / sequences / shots
+            for episode in _list_directories(scene_path):
                 episode_path = os.path.join(scene_path, episode)
-                if not os.path.isdir(episode_path):
-                    continue
 
                 # Scan sequences
-                for sequence in os.listdir(episode_path):
+                for sequence in _list_directories(episode_path):
                     sequence_path = os.path.join(episode_path, sequence)
-                    if not os.path.isdir(sequence_path):
-                        continue
 
                     # Scan shots
-                    for shot in os.listdir(sequence_path):
+                    for shot in _list_directories(sequence_path):
                         shot_path = os.path.join(sequence_path, shot)
-                        if not os.path.isdir(shot_path):
-                            continue
 
                         # Find latest version for this shot
                         latest_version = self._find_latest_shot_version(shot_path)
@@ -4093,12 +4589,11 @@ if __name__ == "__main__":
 
             # Find all version directories
             versions = []
-            for item in os.listdir(anim_path):
-                version_path = os.path.join(anim_path, item)
-                if os.path.isdir(version_path) and item.startswith('v'):
+            for item in _subdir_names(anim_path):
+                if item.startswith('v'):
                     try:
                         version_num = int(item[1:])  # Remove 'v' prefix
-                        versions.append((version_num, item, version_path))
+                        versions.append((version_num, item, os.path.join(anim_path, item)))
                     except ValueError:
                         continue
 
@@ -4110,11 +4605,8 @@ if __name__ == "__main__":
             latest_version_num, latest_version_dir, latest_version_path = versions[0]
 
             # Find cache files in latest version
-            cache_files = []
-            if os.path.exists(latest_version_path):
-                for filename in os.listdir(latest_version_path):
-                    if filename.endswith('.abc'):
-                        cache_files.append(filename)
+            cache_files = [filename for filename in os.listdir(latest_version_path)
+                           if filename.endswith('.abc')]
 
             if cache_files:
                 return {
@@ -4270,8 +4762,6 @@ if __name__ == "__main__":
     def _ask_batch_build_method(self):
         """Ask user which batch build method to use."""
         try:
-            from PySide2 import QtWidgets
-
             msg = QtWidgets.QMessageBox()
             msg.setWindowTitle("Batch Build Method")
             msg.setText("Choose batch build method:")
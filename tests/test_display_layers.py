@@ -183,6 +183,54 @@ class TestDisplayLayerManager(unittest.TestCase):
 
         self.assertEqual(self.mock_cmds.layer_visibility[layer], 0)
 
+    def test_set_layers_visibility(self):
+        """Test setting visibility on several layers at once."""
+        self.manager.set_layers_visibility(['CTX_Active', 'CTX_Inactive'], False)
+
+        self.assertEqual(self.mock_cmds.layer_visibility['CTX_Active'], 0)
+        self.assertEqual(self.mock_cmds.layer_visibility['CTX_Inactive'], 0)
+
+        self.manager.set_layers_visibility(['CTX_Active', 'CTX_Inactive'], True)
+
+        self.assertEqual(self.mock_cmds.layer_visibility['CTX_Active'], 1)
+        self.assertEqual(self.mock_cmds.layer_visibility['CTX_Inactive'], 1)
+
+    def test_set_layers_visibility_single_mel_call(self):
+        """Test batched visibility refreshes the Layer Editor in the same MEL call."""
+        import types
+
+        calls = []
+        fake_maya = types.ModuleType('maya')
+        fake_mel = types.ModuleType('maya.mel')
+        fake_mel.eval = calls.append
+        fake_maya.mel = fake_mel
+        saved = dict((name, sys.modules.get(name)) for name in ('maya', 'maya.mel'))
+        sys.modules['maya'] = fake_maya
+        sys.modules['maya.mel'] = fake_mel
+        try:
+            self.manager.set_layers_visibility(['CTX_Active', 'CTX_Inactive'], False)
+        finally:
+            for name, module in saved.items():
+                if module is None:
+                    sys.modules.pop(name, None)
+                else:
+                    sys.modules[name] = module
+
+        self.assertEqual(len(calls), 1)
+        self.assertIn('setAttr "CTX_Active.visibility" 0', calls[0])
+        self.assertIn('layerButton -edit -layerVisible 0 "CTX_Active"', calls[0])
+        self.assertIn('layerButton -edit -layerVisible 0 "CTX_Inactive"', calls[0])
+
+    def test_ensure_global_layers_recreates_deleted_layer(self):
+        """Test a global layer deleted mid-scene is created again."""
+        self.manager.ensure_global_layers()
+        self.mock_cmds.delete('CTX_Active')
+
+        self.manager.ensure_global_layers()
+
+        self.assertIn('CTX_Active', self.mock_cmds.layers)
+        self.assertEqual(self.mock_cmds.layer_visibility['CTX_Active'], 1)
+
     def test_get_layer_for_shot(self):
         """Test getting layer for shot."""
         layer = self.manager.create_display_layer('Ep04', 'sq0070', 'SH0170')
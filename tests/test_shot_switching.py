@@ -187,6 +187,13 @@ class TestShotSwitcher(unittest.TestCase):
         active = self.switcher.get_active_shot('CTX_Manager')
         self.assertEqual(active, 'CTX_Shot_SH0170')
 
+    def test_switch_to_shot_debounced_without_event_loop(self):
+        """Test debounced switch runs immediately without a Qt application."""
+        self.switcher.switch_to_shot_debounced('CTX_Shot_SH0170', 'CTX_Manager')
+
+        active = self.switcher.get_active_shot('CTX_Manager')
+        self.assertEqual(active, 'CTX_Shot_SH0170')
+
     def test_get_active_shot_none(self):
         """Test getting active shot when none set."""
         active = self.switcher.get_active_shot('CTX_Manager')
@@ -283,6 +290,63 @@ class TestShotSwitcher(unittest.TestCase):
         self.assertEqual(self.mock_cmds.layer_visibility[layer2], 1)
 
 
+    def test_shots_cached_until_connection_change(self):
+        """Test connected shots are cached until a scriptJob fires."""
+        calls = []
+        jobs = {}
+        killed = []
+        next_id = [0]
+
+        def listConnections(node, **kwargs):
+            calls.append(node)
+            return ['CTX_Shot_SH0170', 'CTX_Shot_SH0180']
+
+        def scriptJob(**kwargs):
+            if 'exists' in kwargs:
+                return kwargs['exists'] in jobs
+            if 'kill' in kwargs:
+                killed.append(kwargs['kill'])
+                jobs.pop(kwargs['kill'], None)
+                return None
+            spec = kwargs.get('connectionChange') or kwargs.get('event')
+            next_id[0] += 1
+            jobs[next_id[0]] = (spec[0], spec[1], kwargs.get('runOnce', False))
+            return next_id[0]
+
+        def fire(name):
+            for job_id, (trigger, callback, run_once) in list(jobs.items()):
+                if trigger == name:
+                    if run_once:
+                        del jobs[job_id]
+                    callback()
+
+        self.mock_cmds.listConnections = listConnections
+        self.mock_cmds.scriptJob = scriptJob
+
+        self.switcher._get_shots('CTX_Manager')
+        shots = self.switcher._get_shots('CTX_Manager')
+        self.assertEqual(shots, ['CTX_Shot_SH0170', 'CTX_Shot_SH0180'])
+        self.assertEqual(len(calls), 1)
+
+        # Connection change on the manager drops its cached shots
+        fire('CTX_Manager.shots')
+        self.switcher._get_shots('CTX_Manager')
+        self.assertEqual(len(calls), 2)
+
+        # A rename anywhere drops the cache too
+        fire('NameChanged')
+        self.switcher._get_shots('CTX_Manager')
+        self.assertEqual(len(calls), 3)
+
+        # Scene-event jobs are only registered once
+        events = [job[0] for job in jobs.values()
+                  if job[0] in ShotSwitcher.CACHE_RESET_EVENTS]
+        self.assertEqual(sorted(events), sorted(ShotSwitcher.CACHE_RESET_EVENTS))
+
+        # Teardown kills every remaining job
+        self.switcher.cleanup()
+        self.assertEqual(jobs, {})
+
 if __name__ == '__main__':
     unittest.main()
 
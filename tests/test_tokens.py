@@ -82,6 +82,13 @@ class TestTokenExpander(unittest.TestCase):
         
         self.assertEqual(result, '')
     
+    def test_expand_tokens_no_tokens(self):
+        """Test template without tokens is returned unchanged."""
+        template = 'V:/SWA/all/scene/Ep04/sq0070/SH0170'
+        result = self.expander.expand_tokens(template, self.context)
+        
+        self.assertIs(result, template)
+    
     def test_validate_template_valid(self):
         """Test validating valid template."""
         template = '$ep/$seq/$shot'
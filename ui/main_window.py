@@ -10,6 +10,7 @@ from __future__ import print_function
 
 import logging
 import os
+import weakref
 
 try:
     from PySide6 import QtWidgets, QtCore, QtGui
@@ -31,16 +32,20 @@ logger = logging.getLogger(__name__)
 class MainWindow(QtWidgets.QMainWindow):
     """Multishot Manager main window."""
 
-    # Class variable to track existing instance
+    # Class variable holding the live window; it is the only strong reference
+    # when the window is shown without a parent and the caller drops it
     _instance = None
+    # Every window created, weakly, so stale ones can be closed without being
+    # kept alive (e.g. repeated exec() reloads that never saw a close)
+    _instances = weakref.WeakSet()
 
     def __init__(self, parent=None):
-        # Close existing instance if it exists
-        if MainWindow._instance is not None:
+        # Close existing instances if any
+        MainWindow._instance = None
+        for old_instance in list(MainWindow._instances):
+            MainWindow._instances.discard(old_instance)
             try:
                 logger.info("Closing existing Multishot Manager window")
-                old_instance = MainWindow._instance
-                MainWindow._instance = None
 
                 # Hide first for immediate visual feedback
                 old_instance.hide()
@@ -54,12 +59,12 @@ class MainWindow(QtWidgets.QMainWindow):
 
             except Exception as e:
                 logger.warning("Error closing existing window: %s", e)
-                MainWindow._instance = None
 
         super(MainWindow, self).__init__(parent)
 
         # Store this instance
         MainWindow._instance = self
+        MainWindow._instances.add(self)
 
         self._config = None
         self._context_manager = ContextManager()
@@ -86,8 +91,12 @@ class MainWindow(QtWidgets.QMainWindow):
         """Handle window close event."""
         # Unregister context callback
         self._context_manager.unregister_callback(self._on_context_changed)
+        self._layer_manager.unregister_scene_callbacks()
+        self._shot_switcher.cleanup()
         # Clear instance reference when window is closed
-        MainWindow._instance = None
+        if MainWindow._instance is self:
+            MainWindow._instance = None
+        MainWindow._instances.discard(self)
         super(MainWindow, self).closeEvent(event)
     
     def _setup_ui(self):